@@ -11,7 +11,7 @@
 ####################################################################
 
 import datetime
-from ldap3 import Server, Connection
+from ldap3 import Server, Connection, NONE
 import os
 import sys
 import getopt
@@ -54,6 +54,10 @@ ldap_group_basedn = ""
 ldap_defaultadmin_user = ""
 ldap_url = ""
 
+# LDAP Server objects created for each server URL, reused across queries.
+# Server info (root DSE and schema) is not needed for search validation and is not requested.
+ldap_servers = {}
+
 
 # --------------------------------------------------------------------------------------------------
 def import_site_default(yaml_file, ldap_logger, sas_logger):
@@ -69,7 +73,7 @@ def import_site_default(yaml_file, ldap_logger, sas_logger):
     """
 
     try:
-        ldap_logger.info("Importing sitedefault: " + yaml_file)
+        ldap_logger.info("Importing sitedefault: %s", yaml_file)
 
         # Read the yaml file
         with open(yaml_file, 'r') as yfile:
@@ -82,7 +86,7 @@ def import_site_default(yaml_file, ldap_logger, sas_logger):
                 sys.exit(ldap_messages.BAD_SITEYAML_RC_)
         yfile.close()
 
-        ldap_logger.info("Successfully loaded yaml file '" + str(yaml_file) + "'")
+        ldap_logger.info("Successfully loaded yaml file '%s'", yaml_file)
 
         # define simpler variables
         global ldap_server_host
@@ -106,26 +110,26 @@ def import_site_default(yaml_file, ldap_logger, sas_logger):
             ldap_group_basedn = yaml_content['config']['application']['sas.identities.providers.ldap.group']['baseDN']
             ldap_defaultadmin_user = yaml_content['config']['application']['sas.identities']['administrator']
         except (TypeError, KeyError) as e:
-            ldap_logger.exception("Failure while parsing sitedefault file. Check sitedefault file. " + str(e))
+            ldap_logger.exception("Failure while parsing sitedefault file. Check sitedefault file. %s", e)
             print("Failure while parsing sitedefault file." + str(e))
             print("Check log file: " + sas_logger.get_log_file())
             sys.exit(ldap_messages.BAD_SITEYAML_RC_)
 
         ldap_protocol = ldap_url.split(':')[0]
 
-        ldap_logger.debug("LDAP URL:                       " + str(ldap_url))
-        ldap_logger.debug("LDAP Protocol:                  " + str(ldap_protocol))
-        ldap_logger.debug("LDAP ServerHost:                " + str(ldap_server_host))
-        ldap_logger.debug("LDAP Server Port:               " + str(ldap_server_port))
+        ldap_logger.debug("LDAP URL:                       %s", ldap_url)
+        ldap_logger.debug("LDAP Protocol:                  %s", ldap_protocol)
+        ldap_logger.debug("LDAP ServerHost:                %s", ldap_server_host)
+        ldap_logger.debug("LDAP Server Port:               %s", ldap_server_port)
         if (ldap_bind_pw is not None):
             ldap_logger.debug("LDAP Anonymous Bind Password:   SET")
         else:
             ldap_logger.debug("LDAP Anonymous Bind Password:   UNSET")
 
-        ldap_logger.debug("LDAP Anonymous Bind User DN:    " + str(ldap_bind_userdn))
-        ldap_logger.debug("LDAP User DN:                   " + str(ldap_user_basedn))
-        ldap_logger.debug("LDAP Group DN:                  " + str(ldap_group_basedn))
-        ldap_logger.debug("LDAP Default Admin User:        " + str(ldap_defaultadmin_user))
+        ldap_logger.debug("LDAP Anonymous Bind User DN:    %s", ldap_bind_userdn)
+        ldap_logger.debug("LDAP User DN:                   %s", ldap_user_basedn)
+        ldap_logger.debug("LDAP Group DN:                  %s", ldap_group_basedn)
+        ldap_logger.debug("LDAP Default Admin User:        %s", ldap_defaultadmin_user)
 
         try:
             # check to see if the provided values are valid
@@ -148,7 +152,7 @@ def import_site_default(yaml_file, ldap_logger, sas_logger):
             err_msg = "Error: LDAP Administrator is undefined."
             assert(ldap_defaultadmin_user is not None)
         except (AssertionError, TypeError):
-            ldap_logger.exception("Errors in sitedefault file. {}".format(err_msg))
+            ldap_logger.exception("Errors in sitedefault file. %s", err_msg)
             print("Errors in sitedefault file. {}".format(err_msg))
             print("Check log file: " + sas_logger.get_log_file())
             print()
@@ -231,7 +235,7 @@ def ping_host(ldap_logger):
         success flag(bool) - Success/Failure of ping
     """
 
-    ldap_logger.debug("Attempting to ping LDAP server host at " + str(ldap_server_host))
+    ldap_logger.debug("Attempting to ping LDAP server host at %s", ldap_server_host)
 
     response = os.system("ping -c 1 " + ldap_server_host)
 
@@ -244,6 +248,24 @@ def ping_host(ldap_logger):
     return False
 
 
+# --------------------------------------------------------------------------------------------------
+def get_ldap_server(ldap_server):
+    """
+    Return the LDAP Server object for the specified host, creating it on first use.
+
+    Argument:
+        ldap_server    - name of LDAP server
+    Returns:
+        server(Server) - the LDAP Server object for the host
+    """
+
+    server_url = ldap_protocol + "://" + str(ldap_server)
+    if server_url not in ldap_servers:
+        ldap_servers[server_url] = Server(server_url, get_info=NONE)
+
+    return ldap_servers[server_url]
+
+
 # --------------------------------------------------------------------------------------------------
 def perform_ldap_query(ldap_logger, ldap_server, searchbase, searchfilter, verify=False):
     """    Execute a query on the defined LDAP server.\n
@@ -257,28 +279,28 @@ def perform_ldap_query(ldap_logger, ldap_server, searchbase, searchfilter, verif
         success flag(bool) - Success/Failure of query
     """
 
-    ldap_logger.debug(" ldap_server = " + str(ldap_server) + ", searchbase = " + str(searchbase) +
-                      ", searchFilter = " + str(searchfilter) + ", verify = " + str(verify))
+    ldap_logger.debug(" ldap_server = %s, searchbase = %s, searchFilter = %s, verify = %s",
+                      ldap_server, searchbase, searchfilter, verify)
     # perform search
 
     try:
         ldap_logger.debug("--------------------------------------------------------------------")
-        server = Server(ldap_protocol + "://" + str(ldap_server))
+        server = get_ldap_server(ldap_server)
         ldap_logger.debug("Attempting to create connection binding.")
         connection = Connection(server, ldap_bind_userdn, ldap_bind_pw, auto_bind=True)
-        ldap_logger.debug("Bind results: " + str(connection))
+        ldap_logger.debug("Bind results: %s", connection)
         try:
             ldap_logger.debug("--------------------------------------------------------------------")
-            ldap_logger.debug("LDAP Query: search_base=" + str(searchbase) + ", search_filter=" + str(searchfilter) +
-                              "verify=" + str(verify))
+            ldap_logger.debug("LDAP Query: search_base=%s, search_filter=%s, verify=%s",
+                              searchbase, searchfilter, verify)
             connection.search(search_base=searchbase, search_filter=searchfilter, size_limit=sizeLimit)
             response = json.loads(connection.response_to_json())
         except Exception as e:
-            ldap_logger.exception("LDAP search failed with the following error: " + str(e))
+            ldap_logger.exception("LDAP search failed with the following error: %s", e)
             connection.unbind()
             return False
     except LDAPException as e:
-        ldap_logger.exception("Failed connect to Server: " + str(server) + " with error " + str(e))
+        ldap_logger.exception("Failed connect to Server: %s with error %s", ldap_server, e)
         return False
     # parse connection result, response, entries
 
@@ -298,26 +320,29 @@ def parse_connection_results(ldap_logger, response, result, entries, verify):
     Returns:
         success flag(bool) - Success/Failure of query
     """
-    results_returned = False
-    ldap_logger.debug("json response LDAP Server connection {}".format(str(response)))
-    ldap_logger.debug("connection result{}".format(pprint.pformat(result)))
-    ldap_logger.debug("connection entries {}".format(pprint.pformat(entries)))
+    # the response, result and entries dumps are only built when they will be logged
+    debug_enabled = ldap_logger.isEnabledFor(logging.DEBUG)
+    if debug_enabled:
+        ldap_logger.debug("json response LDAP Server connection %s", response)
+        ldap_logger.debug("connection result%s", pprint.pformat(result))
+        ldap_logger.debug("connection entries %s", pprint.pformat(entries))
     if not(result):
         ldap_logger.error("connection.result is empty")
         return False
     query_rc = int(result['result'])
-    ldap_logger.debug("--------------------------------------------------------------------")
-    ldap_logger.debug("Search query return code: " + str(query_rc))
-    ldap_logger.debug("--------------------------------------------------------------------")
-    ldap_logger.debug("Response: " + str(response['entries']))
-    ldap_logger.debug("--------------------------------------------------------------------")
-    ldap_logger.debug("Result: " + str(result))
-    ldap_logger.debug("--------------------------------------------------------------------")
-    ldap_logger.debug("Entries: ")
-    for entry in entries:
-        results_returned = True
-        ldap_logger.debug(str(entry))
-    ldap_logger.debug("--------------------------------------------------------------------")
+    results_returned = len(entries) > 0
+    if debug_enabled:
+        ldap_logger.debug("--------------------------------------------------------------------")
+        ldap_logger.debug("Search query return code: %s", query_rc)
+        ldap_logger.debug("--------------------------------------------------------------------")
+        ldap_logger.debug("Response: %s", response['entries'])
+        ldap_logger.debug("--------------------------------------------------------------------")
+        ldap_logger.debug("Result: %s", result)
+        ldap_logger.debug("--------------------------------------------------------------------")
+        ldap_logger.debug("Entries: ")
+        for entry in entries:
+            ldap_logger.debug("%s", entry)
+        ldap_logger.debug("--------------------------------------------------------------------")
 
     if (verify):
         try:
@@ -328,7 +353,7 @@ def parse_connection_results(ldap_logger, response, result, entries, verify):
     try:
         assert(query_rc == 0 or query_rc == 4)
     except AssertionError:
-        ldap_logger.exception("Error: LDAP Search query failed with return code: " + str(query_rc))
+        ldap_logger.exception("Error: LDAP Search query failed with return code: %s", query_rc)
         return False
 
     ldap_logger.info("LDAP search queries completed successfully")
@@ -421,11 +446,11 @@ def main(argv):
 
     if not os.path.exists(sitedefault_loc):
         print("Invalid config yaml specified: " + str(sitedefault_loc))
-        ldap_logger.error("Invalid config yaml specified: " + str(sitedefault_loc))
+        ldap_logger.error("Invalid config yaml specified: %s", sitedefault_loc)
         usage(ldap_messages.BAD_OPT_RC_)
 
     # Show command line
-    ldap_logger.debug("Command line: " + str(sys.argv))
+    ldap_logger.debug("Command line: %s", sys.argv)
 
     # Load site default and define variables
     is_imported = import_site_default(sitedefault_loc, ldap_logger, sas_logger)
@@ -437,7 +462,7 @@ def main(argv):
         print("SUCCESS: All LDAP search queries completed successfully.")
         ldap_logger.info("SUCCESS: All LDAP search queries completed successfully.")
         print("Log: " + validator_log_path)
-        ldap_logger.info("Log: " + str(validator_log_path))
+        ldap_logger.info("Log: %s", validator_log_path)
         return exit(ldap_messages.SUCCESS_RC_)
 
 
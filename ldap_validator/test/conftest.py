@@ -0,0 +1,107 @@
+####################################################################
+# ### conftest.py                                                ###
+####################################################################
+# ### Author: SAS Institute Inc.                                 ###
+####################################################################
+#                                                                ###
+# Copyright (c) 2021, SAS Institute Inc., Cary, NC, USA.         ###
+# All Rights Reserved.                                           ###
+# SPDX-License-Identifier: Apache-2.0                            ###
+#                                                                ###
+####################################################################
+import io
+import logging
+import os
+import pytest
+
+from logging.handlers import MemoryHandler
+from pathlib import Path
+from typing import Dict, Iterator
+
+from viya_ark_library.logging import ViyaARKLogger
+
+_TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+
+####################################################################
+# Unit Test Fixture Names                                        ###
+####################################################################
+SAS_LOGGER_FIXTURE = "sas_logger"
+LDAP_LOGGER_FIXTURE = "ldap_logger"
+SITEDEFAULT_DIR_FIXTURE = "sitedefault_dir"
+SITEDEFAULT_FILES_FIXTURE = "sitedefault_files"
+CACHED_SITEDEFAULT_OPEN_FIXTURE = "cached_sitedefault_open"
+
+####################################################################
+# Unit Test Data Paths                                           ###
+####################################################################
+YAML_DIR: Path = Path(_TEST_DIR, "test_data", "yaml_data")
+
+
+####################################################################
+# Unit Test Fixtures                                             ###
+####################################################################
+@pytest.fixture(name=SAS_LOGGER_FIXTURE, scope="session")
+def sas_logger_fixture() -> Iterator[ViyaARKLogger]:
+    """
+    This fixture creates the ViyaARKLogger shared by all ldap_validator tests. Records are buffered in memory and
+    written to the log file in batches rather than one write per record; the buffer is flushed at session end.
+
+    :return: The ViyaARKLogger writing to test_report.log.
+    """
+    sas_logger = ViyaARKLogger("test_report.log", logging_level=logging.INFO, logger_name="test_logger")
+    logger = sas_logger.get_logger()
+
+    memory_handler = MemoryHandler(capacity=1024, flushLevel=logging.CRITICAL, target=sas_logger.f_handler)
+    logger.removeHandler(sas_logger.f_handler)
+    logger.addHandler(memory_handler)
+
+    yield sas_logger
+
+    logger.removeHandler(memory_handler)
+    memory_handler.close()
+    sas_logger.f_handler.close()
+
+
+@pytest.fixture(name=LDAP_LOGGER_FIXTURE, scope="session")
+def ldap_logger_fixture(sas_logger: ViyaARKLogger) -> logging.Logger:
+    """
+    This fixture returns the Logger managed by the shared ViyaARKLogger.
+
+    :return: The Logger used by the ldap_validator functions under test.
+    """
+    return sas_logger.get_logger()
+
+
+@pytest.fixture(name=SITEDEFAULT_DIR_FIXTURE, scope="session")
+def sitedefault_dir_fixture() -> Path:
+    """
+    This fixture returns the directory containing the test sitedefault files.
+
+    :return: The full path to the test yaml data directory.
+    """
+    return YAML_DIR
+
+
+@pytest.fixture(name=SITEDEFAULT_FILES_FIXTURE, scope="session")
+def sitedefault_files_fixture() -> Dict:
+    """
+    This fixture reads the contents of every test sitedefault file once per session.
+
+    :return: A dictionary of file contents keyed by file name.
+    """
+    return {yaml_file.name: yaml_file.read_text() for yaml_file in YAML_DIR.glob("*.yml")}
+
+
+@pytest.fixture(name=CACHED_SITEDEFAULT_OPEN_FIXTURE)
+def cached_sitedefault_open_fixture(sitedefault_files: Dict, monkeypatch):
+    """
+    This fixture replaces open() in the ldap_validator module so that sitedefault files are served from the
+    session cache. Files not present in the cache raise FileNotFoundError, as open() would.
+    """
+    def _open(file, *args, **kwargs):
+        file_name = os.path.basename(file)
+        if file_name not in sitedefault_files:
+            raise FileNotFoundError(file)
+        return io.StringIO(sitedefault_files[file_name])
+
+    monkeypatch.setattr("ldap_validator.ldap_validator.open", _open, raising=False)
@@ -10,155 +10,118 @@
 # SPDX-License-Identifier: Apache-2.0                            ###
 #                                                                ###
 ####################################################################
-import os
-import sys
-
+"""PYTEST_DONT_REWRITE"""
 import logging
+from types import MappingProxyType
+
 import pytest
 
+from ldap3 import NONE
+from ldap3.core.exceptions import LDAPSocketOpenError
+
 from ldap_validator.ldap_validator import ping_host, parse_connection_results, import_site_default, perform_ldap_query
-from ldap_validator.ldap_validator import failTestSuite
-from viya_ark_library.logging import ViyaARKLogger
+from ldap_validator.ldap_validator import failTestSuite, get_ldap_server
+
+# connection result, entries and response returned by a size-limited search;
+# read-only since parse_connection_results never modifies its arguments
+BASE_RESULT = MappingProxyType({'description': 'sizeLimitExceeded', 'dn': '', 'message': '', 'referrals': None,
+                                'result': 4, 'type': 'searchResDone'})
+
+
+def _entry(dn: str) -> MappingProxyType:
+    return MappingProxyType({'attributes': MappingProxyType({}), 'dn': dn})
+
 
-sas_logger = ViyaARKLogger("test_report.log", logging_level=logging.INFO, logger_name="test_logger")
-ldap_logger = sas_logger.get_logger()
-# setup sys.path for import of viya_constants
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)))
-#
-# setup sys.path for import of ldap_constants
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)))
+FULL_ENTRIES = (_entry('DC=SAS,DC=com'),
+                _entry('OU=Microsoft Exchange Security Groups,DC=SAS,DC=com'),
+                _entry('CN=Exchange Servers,OU=Microsoft Exchange Security Groups,DC=SAS,DC=com'),
+                _entry('CN=Exchange Organization Administrators,OU=Microsoft Exchange Security Groups,DC=SAS,DC=com'),
+                _entry('CN=Exchange Recipient Administrators,OU=Microsoft Exchange Security Groups,DC=SAS,DC=com'))
+RESPONSE = MappingProxyType({"entries": (_entry("OU=Groups,DC=na,DC=SAS,DC=com"),
+                                         _entry("CN=[PTD] XML Case Study Team,OU=Groups,DC=na,DC=SAS,DC=com"),
+                                         _entry("CN=PMM PAM Team,OU=Groups,DC=na,DC=SAS,DC=com"),
+                                         _entry("CN=CCG Cumulus Digital Asset Management System,OU=Groups,"
+                                                "DC=na,DC=SAS,DC=com"),
+                                         _entry("CN=VSTI ONDEMAND,OU=Groups,DC=na,DC=SAS,DC=com"))})
 
 
-def test_pinghost():
+def test_pinghost(ldap_logger, monkeypatch):
+    # simulate a failed ping rather than probing the network
+    monkeypatch.setattr("ldap_validator.ldap_validator.os.system", lambda command: 256)
     result = ping_host(ldap_logger)
     assert(result is False)
 
 
-def test_failTestSuite():
-    with pytest.raises(SystemExit) as pytest_wrapped_e:
-        failTestSuite(ldap_logger)
-    assert pytest_wrapped_e.type == SystemExit
-    assert pytest_wrapped_e.value.code == 3
-
-
-def test_parse_connection_results_true():
-    result = {'description': 'sizeLimitExceeded', 'dn': '', 'message': '', 'referrals': None,
-              'result': 4, 'type': 'searchResDone'}
-    entries = [{'attributes': {},
-                'dn': 'DC=SAS,DC=com'},
-               {'attributes': {},
-                'dn': 'OU=Microsoft Exchange Security Groups,DC=SAS,DC=com'},
-               {'attributes': {},
-                'dn': 'CN=Exchange Servers,OU=Microsoft Exchange Security Groups,DC=SAS,DC=com'},
-               {'attributes': {},
-                'dn': 'CN=Exchange Organization Administrators,OU=Microsoft Exchange Security Groups,DC=SAS,DC=com'},
-               {'attributes': {},
-                'dn': 'CN=Exchange Recipient Administrators,OU=Microsoft Exchange Security Groups,DC=SAS,DC=com'}]
-    response = \
-        {"entries": [{"attributes": {}, "dn": "OU=Groups,DC=na,DC=SAS,DC=com"},
-                     {"attributes": {}, "dn": "CN=[PTD] XML Case Study Team,OU=Groups,DC=na,DC=SAS,DC=com"},
-                     {"attributes": {}, "dn": "CN=PMM PAM Team,OU=Groups,DC=na,DC=SAS,DC=com"},
-                     {"attributes": {}, "dn": "CN=CCG Cumulus Digital Asset Management System,OU=Groups,DC=na,"
-                                              "DC=SAS,DC=com"},
-                     {"attributes": {}, "dn": "CN=VSTI ONDEMAND,OU=Groups,DC=na,DC=SAS,DC=com"}]}
-    verify = True
-    parse_result: bool = parse_connection_results(ldap_logger, response, result, entries, verify)
-    ldap_logger.info(" Parse result is " + str(parse_result))
-    assert(parse_result is True)
+def test_pinghost_active(ldap_logger, monkeypatch):
+    monkeypatch.setattr("ldap_validator.ldap_validator.os.system", lambda command: 0)
+    result = ping_host(ldap_logger)
+    assert(result is True)
 
 
-def test_parse_connection_results_false():
-    result = {'description': 'sizeLimitExceeded', 'dn': '', 'message': '', 'referrals': None,
-              'result': 999, 'type': 'searchResDone'}
-    entries = [{'attributes': {}, 'dn': 'DC=SAS,DC=com'},
-               {'attributes': {}, 'dn': 'OU=Microsoft Exchange Security Groups,DC=SAS,DC=com'},
-               {'attributes': {}, 'dn': 'CN=Exchange Servers,OU=Microsoft Exchange Security Groups,DC=SAS,DC=com'},
-               {'attributes': {}, 'dn': 'CN=Exchange Organization Administrators,OU=Microsoft Exchange Security Groups,'
-                                        'DC=SAS,DC=com'},
-               {'attributes': {}, 'dn': 'CN=Exchange Recipient Administrators,OU=Microsoft Exchange Security Groups,'
-                                        'DC=SAS,DC=com'}]
-    response = {"entries": [{"attributes": {}, "dn": "OU=Groups,DC=na,DC=SAS,DC=com"},
-                            {"attributes": {}, "dn": "CN=[PTD] XML Case Study Team,OU=Groups,DC=na,DC=SAS,DC=com"},
-                            {"attributes": {}, "dn": "CN=PMM PAM Team,OU=Groups,DC=na,DC=SAS,DC=com"},
-                            {"attributes": {}, "dn": "CN=CCG Cumulus Digital Asset Management System,OU=Groups,"
-                                                     "DC=na,DC=SAS,DC=com"},
-                            {"attributes": {}, "dn": "CN=VSTI ONDEMAND,OU=Groups,DC=na,DC=SAS,DC=com"}]}
-    verify = True
-    parse_result: bool = parse_connection_results(ldap_logger, response, result, entries, verify)
-    ldap_logger.info(" Parse result is " + str(parse_result))
-    assert(parse_result is False)
+def _assert_exits(function, *args, code: int = 3):
+    with pytest.raises(SystemExit) as pytest_wrapped_e:
+        function(*args)
+    assert pytest_wrapped_e.value.code == code
 
 
-def test_parse_connection_results_empty():
-    result = {'description': 'sizeLimitExceeded', 'dn': '', 'message': '', 'referrals': None,
-              'result': 4, 'type': 'searchResDone'}
-    entries = []
-    response = \
-        {"entries": [
-                {"attributes": {}, "dn": "OU=Groups,DC=na,DC=SAS,DC=com"},
-                {"attributes": {}, "dn": "CN=[PTD] XML Case Study Team,OU=Groups,DC=na,DC=SAS,DC=com"},
-                {"attributes": {}, "dn": "CN=PMM PAM Team,OU=Groups,DC=na,DC=SAS,DC=com"},
-                {"attributes": {}, "dn": "CN=CCG Cumulus Digital Asset Management System,OU=Groups,"
-                                         "DC=na,DC=SAS,DC=com"},
-                {"attributes": {}, "dn": "CN=VSTI ONDEMAND,OU=Groups,DC=na,DC=SAS,DC=com"}]}
-    verify = True
-    parse_result: bool = parse_connection_results(ldap_logger, response, result, entries, verify)
-    ldap_logger.info(" Parse result is " + str(parse_result))
-    assert(parse_result is False)
+def test_failTestSuite(ldap_logger):
+    _assert_exits(failTestSuite, ldap_logger)
 
 
-def test_import_site_default_bad_file_loc():
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    sitedefault_loc = os.path.join(current_dir,
-                                   "test_data" + os.sep + "yaml_data" + os.sep + "testsitedefault_invalid.yml")
-    ldap_logger.info(" sitedefault file = " + str(sitedefault_loc))
-    with pytest.raises(SystemExit) as pytest_wrapped_e:
-        import_site_default(sitedefault_loc, ldap_logger, sas_logger)
-    assert pytest_wrapped_e.type == SystemExit
-    assert pytest_wrapped_e.value.code == 3
-    ldap_logger.info("pytest code" + str(pytest_wrapped_e.value.code))
+@pytest.mark.parametrize("result_code, entries, expected", [
+    (4, FULL_ENTRIES, True),
+    (999, FULL_ENTRIES, False),
+    (4, (), False)
+], ids=["true", "false", "empty"])
+def test_parse_connection_results(result_code, entries, expected, ldap_logger):
+    result = {**BASE_RESULT, "result": result_code}
+    verify = True
+    parse_result: bool = parse_connection_results(ldap_logger, RESPONSE, result, entries, verify)
+    assert(parse_result is expected)
 
 
-def test_import_site_default_keyerror():
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    sitedefault_loc = os.path.join(current_dir, "test_data" + os.sep + "yaml_data" +
-                                   os.sep + "testsitedefault_keyerror.yml")
-    ldap_logger.info(" sitedefault file = " + str(sitedefault_loc))
-    with pytest.raises(SystemExit) as pytest_wrapped_e:
-        import_site_default(sitedefault_loc, ldap_logger, sas_logger)
-    assert pytest_wrapped_e.type == SystemExit
-    assert pytest_wrapped_e.value.code == 3
-    ldap_logger.info("pytest code" + str(pytest_wrapped_e.value.code))
+def test_parse_connection_results_debug(ldap_logger, caplog):
+    caplog.set_level(logging.DEBUG, logger=ldap_logger.name)
+    parse_result: bool = parse_connection_results(ldap_logger, RESPONSE, BASE_RESULT, FULL_ENTRIES, True)
+    assert(parse_result is True)
+    assert("Search query return code: 4" in caplog.text)
+    assert("CN=Exchange Servers,OU=Microsoft Exchange Security Groups,DC=SAS,DC=com" in caplog.text)
 
 
-def test_import_site_default_asserterror():
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    sitedefault_loc = os.path.join(current_dir, "test_data" + os.sep
-                                   + "yaml_data" + os.sep + "testsitedefault_assertion.yml")
-    ldap_logger.info(" sitedefault file = " + str(sitedefault_loc))
-    with pytest.raises(SystemExit) as pytest_wrapped_e:
-        import_site_default(sitedefault_loc, ldap_logger, sas_logger)
-    assert pytest_wrapped_e.type == SystemExit
-    assert pytest_wrapped_e.value.code == 3
-    ldap_logger.info("pytest code" + str(pytest_wrapped_e.value.code))
+@pytest.mark.parametrize("file_name, expected_exit_code", [
+    ("testsitedefault_invalid.yml", 3),
+    ("testsitedefault_keyerror.yml", 3),
+    ("testsitedefault_assertion.yml", 3),
+    # pings the unreachable host named in the sitedefault file
+    pytest.param("testsitedefault_invalidServer.yml", 3, marks=pytest.mark.network)
+], ids=["bad_file_loc", "keyerror", "asserterror", "invalid_server"])
+def test_import_site_default(file_name, expected_exit_code, ldap_logger, sas_logger, sitedefault_dir,
+                             cached_sitedefault_open):
+    sitedefault_loc = str(sitedefault_dir / file_name)
+    _assert_exits(import_site_default, sitedefault_loc, ldap_logger, sas_logger, code=expected_exit_code)
 
 
-def test_import_site_default_valid():
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    sitedefault_loc = os.path.join(current_dir, "test_data" + os.sep + "yaml_data"
-                                   + os.sep + "testsitedefault_invalidServer.yml")
-    ldap_logger.info(" sitedefault file = " + str(sitedefault_loc))
-    with pytest.raises(SystemExit) as pytest_wrapped_e:
-        import_site_default(sitedefault_loc, ldap_logger, sas_logger)
-    assert pytest_wrapped_e.type == SystemExit
-    assert pytest_wrapped_e.value.code == 3
-    ldap_logger.info("pytest code" + str(pytest_wrapped_e.value.code))
+def _raise_socket_open_error(*args, **kwargs):
+    raise LDAPSocketOpenError("unable to open socket")
 
 
-def test_perform_ldat_query_invalid():
+def test_perform_ldat_query_invalid(ldap_logger, monkeypatch):
     searchBase = "OU = Groups, DC = na, DC = SAS, DC = com"
     searchFilter = "(objectclass= *)"
     server = "myldapserver.mycompany.com"
 
+    # fail at Server creation rather than waiting on a DNS lookup and connect timeout
+    monkeypatch.setattr("ldap_validator.ldap_validator.ldap_servers", {})
+    monkeypatch.setattr("ldap_validator.ldap_validator.Server", _raise_socket_open_error)
+
     parse_result = perform_ldap_query(ldap_logger, server, searchBase, searchFilter, False)
     assert(parse_result is False)
+
+
+def test_get_ldap_server_reused(monkeypatch):
+    monkeypatch.setattr("ldap_validator.ldap_validator.ldap_servers", {})
+    monkeypatch.setattr("ldap_validator.ldap_validator.ldap_protocol", "ldap")
+    server = get_ldap_server("myldapserver.mycompany.com")
+    assert(get_ldap_server("myldapserver.mycompany.com") is server)
+    assert(get_ldap_server("otherldapserver.mycompany.com") is not server)
+    assert(server.get_info == NONE)
@@ -12,13 +12,12 @@
 ####################################################################
 
 import re
-from time import gmtime, strftime
+from time import gmtime
 import datetime
+import functools
 import pprint
 import sys
 import os
-import platform
-import subprocess
 import pint
 from subprocess import CalledProcessError
 from typing import Text, Dict
@@ -33,16 +32,73 @@ from pre_install_report.library.pre_install_check_permissions import PreCheckPer
 from pre_install_report.library.pre_install_utils import PreCheckUtils
 from viya_ark_library.k8s.sas_kubectl_interface import KubectlInterface
 from viya_ark_library.jinja2.sas_jinja2 import Jinja2TemplateRenderer
-from viya_ark_library.logging import ViyaARKLogger
+from viya_ark_library.logging import LazyPFormat, ViyaARKLogger
 
 PRP = pprint.PrettyPrinter(indent=4)
 # templates for output file names #
 _REPORT_FILE_NAME_TMPL_ = "viya_pre_install_report_{}.html"
 _REPORT_LOG_NAME_TMPL_ = "viya_pre_install_log_{}.log"
 _FILE_TIMESTAMP_TMPL_ = "%Y-%m-%dT%H_%M_%S"
+# directory holding the report template, resolved once at import
+_TEMPLATES_DIR_ = os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "templates")
+_REPORT_TEMPLATE_NAME_ = "report_template_viya_pre_install_check.j2"
+# Pint definitions for the Kubernetes quantity suffixes
+_KDEFINITIONS_PATH_ = os.path.join(os.path.dirname(os.path.abspath(__file__)), "utils", "kdefinitions.txt")
+# characters removed from cluster-info output, e.g. ANSI color escape sequences
+_ESCAPE_CHARS_RE_ = re.compile('[^.,:/A-Za-z0-9]+')
+# report message templates, with the fixed labels filled in once at import
+_MINIMUM_MSG_TMPL_ = viya_constants.SET + ": {}, " + viya_constants.EXPECTED + ": Minimum {}"
+_ISSUES_FOUND_TMPL_ = "Issues Found: {}"
+_K8S_VERSION_MSG_TMPL_ = viya_constants.SET + ": {}, " + viya_constants.EXPECTED + ": {} or later "
+# resources listed together from the cluster for the report, with the kind of the items each one returns
+_LISTED_RESOURCES_ = {"namespaces": "Namespace", "storageclass": "StorageClass", "nodes": "Node"}
+# annotations marking the default storage class
+_DEFAULT_SC_ANNOTATION_ = "storageclass.kubernetes.io/is-default-class"
+_DEFAULT_SC_BETA_ANNOTATION_ = "storageclass.beta.kubernetes.io/is-default-class"
+# bytes per unit for the Kubernetes memory suffixes, matching utils/kdefinitions.txt
+_MEMORY_SUFFIX_SCALE_ = {'': 1, 'm': 1e-3, 'k': 1e3, 'M': 1e6, 'G': 1e9, 'T': 1e12, 'P': 1e15, 'E': 1e18,
+                         'Ki': 1024, 'Mi': 1024 ** 2, 'Gi': 1024 ** 3, 'Ti': 1024 ** 4, 'Pi': 1024 ** 5,
+                         'Ei': 1024 ** 6}
+
+
+@functools.lru_cache(maxsize=None)
+def get_file_timestamp():
+    """
+    Return the timestamp used in the report and log file names. It is set on first use, not at import, and the
+    same value is returned for the rest of the run.
+    """
+    return datetime.datetime.now().strftime(_FILE_TIMESTAMP_TMPL_)
+
+
+@functools.lru_cache(maxsize=None)
+def _unsupported_k8s_versions(k8s_version_min):
+    """
+    Return the semantic_version spec matching Kubernetes versions older than the validated minimum version.
+    The spec is built once for each minimum version.
+    """
+    return semantic_version.SimpleSpec("<" + k8s_version_min)
 
-# set timestamp for report file
-file_timestamp = datetime.datetime.now().strftime(_FILE_TIMESTAMP_TMPL_)
+
+@functools.lru_cache(maxsize=None)
+def _get_unit_registry():
+    """
+    Return the Pint unit registry loaded with the Kubernetes quantity definitions. Parsing the definitions file is
+    the most expensive part of using Pint, so the registry is built on first use and shared for the rest of the
+    process.
+    """
+    # Register Python Package Pint definitions
+    return UnitRegistry(_KDEFINITIONS_PATH_)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_report_renderer():
+    """
+    Return the renderer for the pre-install report, shared by all ViyaPreInstallCheck objects. The report template
+    is compiled when the renderer is created and reused for every report written in this process.
+    """
+    template_renderer = Jinja2TemplateRenderer(templates_dir=_TEMPLATES_DIR_)
+    template_renderer.get_environment(trim_blocks=True, lstrip_blocks=True).get_template(_REPORT_TEMPLATE_NAME_)
+    return template_renderer
 
 
 class ViyaPreInstallCheck():
@@ -73,6 +129,10 @@ class ViyaPreInstallCheck():
         self._workers = 0
         self._aggregate_nodeStatus_failures = 0
         self._k8s_server_version = None
+        # values that do not change during a run, fetched from the cluster once and reused
+        self._namespace = None
+        self._cluster_info = None
+        self._raw_json_cache = {}
 
     def _parse_release_info(self, release_info):
         """
@@ -83,12 +143,11 @@ class ViyaPreInstallCheck():
         :return tuple of major version, minor version
         """
         try:
-            info = tuple(release_info.split("."))
+            # int() rejects non-numeric parts up front with a ValueError
+            info = tuple(map(int, release_info.split(".")))
             if (len(info) == 2):
-                x = [int(i) for a, i in enumerate(info)]
-                self.logger.debug('release tuple to int {} '.format(x))
-                k8s_min_rel_str = ''.join(release_info)
-                self._validated_kubernetes_version_min = k8s_min_rel_str
+                self.logger.debug('release tuple to int %s ', info)
+                self._validated_kubernetes_version_min = release_info
             else:
                 print('****' + viya_messages.KUBELET_VERSION_ERROR)
                 sys.exit(viya_messages.BAD_OPT_RC_)
@@ -125,7 +184,7 @@ class ViyaPreInstallCheck():
             versions: Dict = utils.get_k8s_version()
             server_version = versions.get('serverVersion')
             git_version = str(server_version.get('gitVersion'))
-            self.logger.debug("git_version {} ".format(git_version))
+            self.logger.debug("git_version %s ", git_version)
             # check git_version is not empty
             if git_version and git_version.startswith("v"):
                 git_version = git_version[1:]
@@ -146,9 +205,8 @@ class ViyaPreInstallCheck():
             curr_version = semantic_version.Version(str(self._k8s_server_version))
 
             self._parse_release_info(self._viya_k8s_version_min)
-            min_k8s_version = "<" + self._validated_kubernetes_version_min
 
-            if(curr_version in semantic_version.SimpleSpec(min_k8s_version)):
+            if(curr_version in _unsupported_k8s_versions(self._validated_kubernetes_version_min)):
                 self.logger.error("This release of Kubernetes is not supported {}.{}.x"
                                   .format(str(curr_version.major),
                                           str(curr_version.minor)))
@@ -162,15 +220,13 @@ class ViyaPreInstallCheck():
     def check_details(self, kubectl,
                       output_dir):
         self._kubectl = kubectl
-        name_space = kubectl.get_namespace()
+        self._namespace = None
+        self._cluster_info = None
+        self._raw_json_cache = {}
+        name_space = self._get_namespace()
         self.logger.info("names_space: {} ".format(name_space))
 
-        # Register Python Package Pint definitions
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        datafile = os.path.join(current_dir, "utils" + os.sep + 'kdefinitions.txt')
-
-        ureg = UnitRegistry(datafile)
-        quantity_ = ureg.Quantity
+        quantity_ = _get_unit_registry().Quantity
 
         pre_check_utils_params = {}
         pre_check_utils_params[viya_constants.KUBECTL] = self._kubectl
@@ -182,6 +238,7 @@ class ViyaPreInstallCheck():
         configs_data = self.get_config_info()
         cluster_info = self._get_master_json()
         master_data = self._check_master(cluster_info)
+        self._get_json_multi(_LISTED_RESOURCES_)
         namespace_data = []
         namespace_data = self._check_available_namespaces(self._get_json("namespaces"), namespace_data)
 
@@ -197,10 +254,11 @@ class ViyaPreInstallCheck():
         params = {}
         params[viya_constants.PERM_CLASS] = utils
         params[viya_constants.SERVER_K8S_VERSION] = self._k8s_server_version
+        params[viya_constants.RAW_JSON_CACHE] = self._raw_json_cache
         params['logger'] = self.sas_logger
 
         permissions_check = PreCheckPermissions(params)
-        self._check_permissions(permissions_check)
+        self._check_permissions(permissions_check, name_space)
 
         test_list = [viya_constants.INSUFFICIENT_PERMS, viya_constants.PERM_SKIPPING]
 
@@ -218,6 +276,34 @@ class ViyaPreInstallCheck():
                              output_dir)
         return
 
+    def _get_json_multi(self, resources):
+        """
+        List several kinds of Kubernetes resources with a single kubectl call and cache the items of each kind
+        as if that resource had been retrieved on its own. If the combined call fails, for example because one of
+        the resources may not be listed, each resource is retrieved separately so the others are still reported.
+
+        resources: dict of the resources to list, each mapped to the kind of the items it returns
+        """
+        try:
+            raw_json = self._kubectl.get_resources(",".join(resources), True)
+        except CalledProcessError as cpe:
+            self.logger.exception("resources %s return code %s", ",".join(resources), cpe.returncode)
+            for resource in resources:
+                self._get_raw_json(resource)
+            return
+
+        items_by_kind = {kind: [] for kind in resources.values()}
+        for item in raw_json['items']:
+            kind_items = items_by_kind.get(item.get('kind'))
+            if kind_items is not None:
+                kind_items.append(item)
+
+        for resource, kind in resources.items():
+            resource_json = {'apiVersion': raw_json.get('apiVersion'), 'kind': raw_json.get('kind'),
+                             'items': items_by_kind[kind]}
+            self.logger.info("resource %s raw JSON %s", resource, LazyPFormat(resource_json))
+            self._raw_json_cache[resource] = resource_json
+
     def _read_environment_var(self, env_var):
         """
         This method verifies that the KUBECONFIG environment variable is set.
@@ -233,20 +319,6 @@ class ViyaPreInstallCheck():
 
         return value_env_var
 
-    def _get_nested_info(self, nested_nodes, extracted_nodes, search_key):
-
-        try:
-            for adtnode in nested_nodes:
-                keys = adtnode.keys()
-                for key in keys:
-                    if key in search_key:
-                        addrnode = [adtnode[key]]
-                        extracted_nodes.append(addrnode)
-            self.logger.debug("extracted nodes: {}".format(pprint.pformat(extracted_nodes)))
-            return extracted_nodes
-        except KeyError:
-            return extracted_nodes
-
     def _get_config_current_context(self, config_json, configs_data):
         """
         Retrieve the current context from kubeconfig file.
@@ -258,20 +330,15 @@ class ViyaPreInstallCheck():
         current_context_data = []
 
         if config_json:
-            try:
-                if len(config_json['current-context']) > 0:
-                    config_data = {'currentcontext': config_json['current-context']}
-                else:
-                    config_data = {'currentcontext': viya_messages.CONFIG_ERROR}
-            except KeyError:
-                config_data = {'currentcontext': viya_constants.KEY_NOT_FOUND}
+            current_context = config_json.get('current-context')
+            if current_context is None:
                 print(viya_messages.CONFIG_ERROR)
-                self.logger.exception(viya_messages.CONFIG_ERROR)
+                self.logger.error(viya_messages.CONFIG_ERROR)
                 sys.exit(viya_messages.BAD_CONFIG_JSON_RC_)
 
-            current_context_data.append(config_data)
+            current_context_data.append({'currentcontext': current_context or viya_messages.CONFIG_ERROR})
 
-        self.logger.debug("current_context_data: " + pprint.pformat(current_context_data))
+        self.logger.debug("current_context_data: %s", LazyPFormat(current_context_data))
 
         configs_data.append(current_context_data)
         return configs_data
@@ -289,26 +356,17 @@ class ViyaPreInstallCheck():
         if config_json:
             try:
                 for config in config_json['contexts']:
-                    config_data = {}
-                    try:
-                        config_data['contextName'] = config['name']
-                    except KeyError:
-                        config_data['contextName'] = viya_constants.KEY_NOT_FOUND
-                    try:
-                        config_data['cluster'] = config['context']['cluster']
-                    except KeyError:
-                        config_data['cluster'] = viya_constants.KEY_NOT_FOUND
-                    try:
-                        config_data['clusteruser'] = config['context']['user']
-                    except KeyError:
-                        config_data['clusteruser'] = viya_constants.KEY_NOT_FOUND
+                    context = config.get('context') or {}
+                    config_data = {'contextName': config.get('name', viya_constants.KEY_NOT_FOUND),
+                                   'cluster': context.get('cluster', viya_constants.KEY_NOT_FOUND),
+                                   'clusteruser': context.get('user', viya_constants.KEY_NOT_FOUND)}
                     context_data.append(config_data)
             except TypeError as error:
                 self.logger.exception("TypeError {}".format(str(error)))
                 print(viya_messages.CONFIG_ERROR)
                 sys.exit(viya_messages.BAD_CONFIG_JSON_RC_)
 
-        self.logger.debug("context_data: {}".format(pprint.pformat(context_data)))
+        self.logger.debug("context_data: %s", LazyPFormat(context_data))
 
         configs_data.append(context_data)
         return configs_data
@@ -326,23 +384,16 @@ class ViyaPreInstallCheck():
         if config_json:
             try:
                 for config in config_json['clusters']:
-                    config_data = {}
-                    try:
-                        config_data['clustername'] = config['name']
-                    except KeyError:
-                        config_data['clustername'] = viya_constants.KEY_NOT_FOUND
-                    try:
-                        config_data['server'] = config['cluster']['server']
-                    except KeyError:
-                        config_data['server'] = viya_constants.KEY_NOT_FOUND
-
+                    config_data = {'clustername': config.get('name', viya_constants.KEY_NOT_FOUND),
+                                   'server': (config.get('cluster') or {}).get('server',
+                                                                               viya_constants.KEY_NOT_FOUND)}
                     cluster_data.append(config_data)
             except TypeError as error:
                 self.logger.exception("TypeError {}".format(str(error)))
                 print(viya_messages.CONFIG_ERROR)
                 sys.exit(viya_messages.BAD_CONFIG_JSON_RC_)
 
-        self.logger.debug("cluster data: {}".format(pprint.pformat(cluster_data)))
+        self.logger.debug("cluster data: %s", LazyPFormat(cluster_data))
         configs_data.append(cluster_data)
         return configs_data
 
@@ -359,21 +410,31 @@ class ViyaPreInstallCheck():
         if config_json:
             try:
                 for config in config_json['users']:
-                    try:
-                        config = {'username': config['name']}
-                    except KeyError:
-                        config = {'username': viya_constants.KEY_NOT_FOUND}
-                    cluster_data.append(config)
+                    cluster_data.append({'username': config.get('name', viya_constants.KEY_NOT_FOUND)})
             except TypeError as e:
                 self.logger.exception("TypeError {}: ".format(str(e)))
                 print(viya_messages.CONFIG_ERROR)
                 sys.exit(viya_messages.BAD_CONFIG_JSON_RC_)
 
-        self.logger.debug("cluster_data: {}".format(pprint.pformat(cluster_data)))
+        self.logger.debug("cluster_data: %s", LazyPFormat(cluster_data))
 
         configs_data.append(cluster_data)
         return configs_data
 
+    def _extract_config(self, config_json):
+        """
+        Parse the current context, contexts, clusters and users sections of the kubectl config view json
+        in a single call. Each section is a separate top level key and is walked exactly once.
+
+        :config_json: json retrieved from the kubectl config view command
+        :return:    list of the current context, contexts, clusters and users lists, in that order
+        """
+        configs_data = []
+        for parse_section in (self._get_config_current_context, self._get_config_contexts,
+                              self._get_config_clusters, self._get_config_users):
+            configs_data = parse_section(config_json, configs_data)
+        return configs_data
+
     def _get_json(self, k8sresource):
         """
         Retrieve the k8s resource information from the Kubernetes cluster in json format.
@@ -400,23 +461,42 @@ class ViyaPreInstallCheck():
                 try:
                     node_data['storageClassNameName'] = node['metadata']['name']
                     node_data['provisioner'] = node['provisioner']
+                    annotations = node['metadata'].get('annotations') or {}
+                    is_default = annotations.get(_DEFAULT_SC_ANNOTATION_) == 'true' or \
+                        annotations.get(_DEFAULT_SC_BETA_ANNOTATION_) == 'true'
+                    node_data['default'] = 'true' if is_default else 'false'
+                    default_cnt += is_default
                     storage_nodes.append(node_data)
                 except KeyError as e:
                     self.logger.exception("KeyError {}".format(str(e)))
 
-        self.logger.debug("storage nodes: {}".format(pprint.pformat(storage_nodes)))
-        storage_items = int(len(storage_nodes))
-        self.logger.debug("Num of storage classes: {}".format(storage_items))
+        self.logger.debug("storage nodes: %s", LazyPFormat(storage_nodes))
+        storage_items = len(storage_nodes)
+        self.logger.debug("Num of storage classes: %s", storage_items)
 
         storage_nodes = self._check_storage_classes(default_cnt, storage_nodes)
         return storage_nodes
 
+    def _get_namespace(self):
+        """
+        Retrieve the target namespace, querying kubectl only on first use
+
+        return: namespace name
+        """
+        if self._namespace is None:
+            self._namespace = self._kubectl.get_namespace()
+        return self._namespace
+
     def _get_master_json(self):
         """
-        Retrieve  the cluster info from Kubernetes
+        Retrieve  the cluster info from Kubernetes. The output, including the output of a failed
+        cluster-info command, is cached so the command is only run once per check.
 
         return: Output from and rc from cluster-info command
         """
+        if self._cluster_info is not None:
+            return self._cluster_info
+
         kubectl = self._kubectl
         data = None
         try:
@@ -425,44 +505,17 @@ class ViyaPreInstallCheck():
             self.logger.exception('cluster-info return_code = {}'.format(str(proc_error.returncode)))
             if proc_error.returncode != 1:
                 data = proc_error.output
-            return str(data)
-        self._read_cluster_info_output(data)
-        return str(data)
-
-    def _read_cluster_info_output(self, data):
-        command = "cat "
-        data = None
-        file_name = "temp_cluste_info.txt"
-        try:
-            file = open(file_name, "w+")
-            file.writelines(str(data))
-            file.close()
-        except Exception:
-            self.logger.exception("Unable to save to {}".format(file_name))
-            return data
-
-        if platform.system() == "Windows":
-            command = "type "
-        try:
-            data = subprocess.check_output(command + file_name, shell=True, universal_newlines=True)
-        except CalledProcessError:
-            self.logger.exception("Windows file_name failed {}".format(file_name))
-            return data
-        self._delete_temp_file(file_name)
-        return str(data)
+        self._cluster_info = str(data)
+        return self._cluster_info
 
-    def _delete_temp_file(self, file_name):
-        if os.path.exists(file_name):
-            os.remove(file_name)
-
-    def _check_permissions(self, permissions_check: PreCheckPermissions):
+    def _check_permissions(self, permissions_check: PreCheckPermissions, namespace):
         """
         Check if permissions are adequate to complete Viya deployment with cluster admin
         and namespace admin lveles of access to cluster resources
 
         permissions_check:  instance of PreCheckPermissions class
+        namespace:  namespace of the current context, as read at the start of the check
         """
-        namespace = self._kubectl.get_namespace()
         permissions_check.get_sc_resources()
 
         permissions_check.manage_pvc(viya_constants.KUBECTL_APPLY, False)
@@ -487,7 +540,7 @@ class ViyaPreInstallCheck():
         line: input string
         return:  string without escape sequences
         """
-        return re.sub('[^.,:/A-Za-z0-9]+', ' ', line).strip()
+        return _ESCAPE_CHARS_RE_.sub(' ', line).strip()
 
     def _check_master(self, cluster_info):
         """
@@ -498,29 +551,28 @@ class ViyaPreInstallCheck():
         """
         master_data = []
         master_nodes = {}
-        masters = int(1)
+        masters = 1
 
         if cluster_info:
             # cluster_strings = cluster_info.splitlines()
-            cluster_strings = str(cluster_info).split("\\n", maxsplit=1)
-            master = str(cluster_strings[0])
+            cluster_strings = cluster_info.split("\\n", maxsplit=1)
+            master = cluster_strings[0]
             index = master.find("Kubernetes")
             no_color = self._escape_ansi(line=master[index:])
-            master_nodes.update({'totalMasters': str(1)})
+            master_nodes.update({'totalMasters': '1'})
             if masters >= viya_constants.NUMBER_OF_MASTER_NODES:
                 master_nodes.update({'status': 0})
-                master_nodes.update({'issue': 'Issues Found: ' + str(0)})
+                master_nodes.update({'issue': 'Issues Found: 0'})
                 if cluster_strings[0]:
-                    master_nodes.update({'firstFailure': str(no_color)})
+                    master_nodes.update({'firstFailure': no_color})
         else:
-            master_nodes.update({'totalMasters': str(viya_constants.SET) + ': 0, ' + str(viya_constants.EXPECTED) +
-                                ': Minimum ' + str(viya_constants.NUMBER_OF_MASTER_NODES)})
+            master_nodes.update({'totalMasters': _MINIMUM_MSG_TMPL_.format(0, viya_constants.NUMBER_OF_MASTER_NODES)})
             master_nodes.update({'status': 1})
-            master_nodes.update({'issue': master_nodes['totalMasters'] + ', ' + 'Issues Found: ' + str(1)})
+            master_nodes.update({'issue': f"{master_nodes['totalMasters']}, {_ISSUES_FOUND_TMPL_.format(1)}"})
             master_nodes.update({'firstFailure': 'Cluster information not available. Check permissions.'})
 
         master_data.append(master_nodes)
-        self.logger.debug("master_data {}".format(pprint.pformat(master_data)))
+        self.logger.debug("master_data %s", LazyPFormat(master_data))
         return master_data
 
     def _check_workers(self, global_data, nodes_data):
@@ -530,69 +582,53 @@ class ViyaPreInstallCheck():
 
         global_data:  list that contains lobal data about nodes
         nodes_data:  list of dict objects, each with node information
-        return: updated global_data list with total number of worker nodes.
+        The global_data list is updated in place with the total number of worker nodes.
         """
         global_nodes = {}
         workers = self._workers
 
-        global_nodes.update({'totalWorkers': str(workers) + ': ' + str(viya_constants.SET + ': ' + str(workers) +
-                                                                       ', ' + str(viya_constants.EXPECTED) +
-                                                                       ': Minimum ' +
-                                                                       str(viya_constants.NUMBER_OF_WORKER_NODES))})
+        minimum_msg = _MINIMUM_MSG_TMPL_.format(workers, viya_constants.NUMBER_OF_WORKER_NODES)
+        global_nodes.update({'totalWorkers': f"{workers}: {minimum_msg}"})
 
         if workers < viya_constants.NUMBER_OF_WORKER_NODES:
             global_nodes.update({'status': 1})
-            global_nodes.update({'issue': 'Issues Found: ' + str(1)})
-            global_nodes.update({'firstFailure':
-                                str(viya_constants.SET + ': ' +
-                                    str(workers) + ', ' +
-                                    str(viya_constants.EXPECTED) +
-                                    ': Minimum ' +
-                                    str(viya_constants.NUMBER_OF_WORKER_NODES) +
-                                    " \nCheck SAS Viya Platform Documentation")})
+            global_nodes.update({'issue': 'Issues Found: 1'})
+            global_nodes.update({'firstFailure': f"{minimum_msg} \nCheck SAS Viya Platform Documentation"})
 
         else:
             global_nodes.update({'status': 0})
-            global_nodes.update({'issue': 'Issues Found: ' + str(0)})
-            global_nodes.update(
-                    {'firstFailure': str(viya_constants.SET +
-                                         ': ' + str(workers)
-                                         + ', ' + str(viya_constants.EXPECTED)
-                                         + ': ' +
-                                         str(viya_constants.NUMBER_OF_WORKER_NODES))})
+            global_nodes.update({'issue': 'Issues Found: 0'})
+            global_nodes.update({'firstFailure': f"{viya_constants.SET}: {workers}, "
+                                                 f"{viya_constants.EXPECTED}: {viya_constants.NUMBER_OF_WORKER_NODES}"})
         global_data.append(global_nodes)
-        self.logger.debug("global_nodes: {}".format(pprint.pformat(global_nodes)))
-        return global_data
+        self.logger.debug("global_nodes: %s", LazyPFormat(global_nodes))
 
     def _set_time(self, global_data):
         """Set the current timestamp for the report in the global data list
 
-        global_data: List to be updated
-        return:  global_data list updated with current time to be added to the report
+        global_data: List to be updated in place with current time to be added to the report
         """
         global_nodes = {}
-        time_string = strftime("%m/%d/%Y, %H:%M:%S", gmtime())
-        time_string = "GMT " + time_string
+        now = gmtime()
+        time_string = f"GMT {now.tm_mon:02d}/{now.tm_mday:02d}/{now.tm_year}, " \
+                      f"{now.tm_hour:02d}:{now.tm_min:02d}:{now.tm_sec:02d}"
 
-        global_nodes.update({'timestamp': str(time_string)})
+        global_nodes.update({'timestamp': time_string})
         global_data.append(global_nodes)
 
-        self.logger.debug("global data{} time{}".format(pprint.pformat(global_data), time_string))
-        return global_data
+        self.logger.debug("global data%s time%s", LazyPFormat(global_data), time_string)
 
     def _update_k8s_version(self, global_data, git_version):
         """Set the Cluster Kubernetes Version for the report in the global data list
 
-        global_data: List to be updated
-        return:  global_data list updated with Kubernetes Version to be added to the report
+        global_data: List to be updated in place with Kubernetes Version to be added to the report
         """
         global_nodes = {}
 
         global_nodes.update({'k8sVersion': str(git_version)})
         global_data.append(global_nodes)
 
-        self.logger.debug("global data{} Kubernetes Version {}".format(pprint.pformat(global_data), git_version))
-        return global_data
+        self.logger.debug("global data%s Kubernetes Version %s", LazyPFormat(global_data), git_version)
 
     def _check_cpu_errors(self, global_data, total_capacity_cpu_cores: float, aggregate_cpu_failures):
         """
@@ -605,9 +641,8 @@ class ViyaPreInstallCheck():
         aggregate_cpu_data = {}
         msg = ''
         error_msg = ""
-        info_msg = str(viya_constants.EXPECTED) + ': ' + \
-            self._viya_min_aggregate_worker_CPU_cores + \
-            ', Calculated: ' + str(round(total_capacity_cpu_cores, 2))
+        info_msg = f"{viya_constants.EXPECTED}: {self._viya_min_aggregate_worker_CPU_cores}, " \
+                   f"Calculated: {round(total_capacity_cpu_cores, 2)}"
 
         min_aggr_worker_cpu_core = self._get_cpu(self._viya_min_aggregate_worker_CPU_cores,
                                                  "VIYA_MIN_AGGREGATE_WORKER_CPU_CORES")
@@ -615,18 +650,16 @@ class ViyaPreInstallCheck():
         if total_capacity_cpu_cores < min_aggr_worker_cpu_core:
             aggregate_cpu_failures += 1
             # Check for combined cpu_core capacity of the Kubernetes nodes in cluster
-        error_msg = viya_constants.SET + ': ' + str(round(total_capacity_cpu_cores, 2)) + \
-            ', ' + str(viya_constants.EXPECTED) + ': ' + self._viya_min_aggregate_worker_CPU_cores
+        error_msg = f"{viya_constants.SET}: {round(total_capacity_cpu_cores, 2)}, " \
+                    f"{viya_constants.EXPECTED}: {self._viya_min_aggregate_worker_CPU_cores}"
         if aggregate_cpu_failures > 0:
             msg = error_msg
         else:
             msg = info_msg
-        aggregate_cpu_data.update({'aggregate_cpu_failures': msg + ', Issues Found: ' + str(aggregate_cpu_failures)})
+        aggregate_cpu_data.update({'aggregate_cpu_failures': f"{msg}, Issues Found: {aggregate_cpu_failures}"})
 
         global_data.append(aggregate_cpu_data)
 
-        return global_data
-
     def _check_memory_errors(self, global_data, total_capacity_memory, quantity_, aggregate_memory_failures):
         """
         Check aggregate memory across all worker nodes against SAS total memory requirement in worker nodes
@@ -641,36 +674,33 @@ class ViyaPreInstallCheck():
 
         total_capacity_memory_toGB = total_capacity_memory.to('G')
 
-        info_msg = str(viya_constants.EXPECTED) + ': ' + \
-            self._viya_min_aggregate_worker_memory + \
-            ', Calculated: ' + str(round(total_capacity_memory_toGB, 2))
+        info_msg = f"{viya_constants.EXPECTED}: {self._viya_min_aggregate_worker_memory}, " \
+                   f"Calculated: {round(total_capacity_memory_toGB, 2)}"
         self._calculated_aggregate_memory = total_capacity_memory_toGB
 
         min_aggr_worker_memory = self._get_memory(self._viya_min_aggregate_worker_memory,
                                                   "VIYA_GENERIC_WORKER_MEMORY", quantity_)
-        self.logger.info("percent {} percent of instance {} total capacity {}".format
-                         (str(viya_constants.VIYA_PERCENTAGE_OF_INSTANCE),
-                          str(min_aggr_worker_memory * (int(viya_constants.VIYA_PERCENTAGE_OF_INSTANCE) / 100)),
-                          str(total_capacity_memory_toGB)))
-        self.logger.info("input memory converted to G {}".format(str(min_aggr_worker_memory.to('G'))))
-        if total_capacity_memory_toGB < \
-                (min_aggr_worker_memory.to('G')) * (int(viya_constants.VIYA_PERCENTAGE_OF_INSTANCE) / 100):
+        # convert the threshold once and reuse it for the log messages and the comparison
+        min_aggr_worker_memory_G = min_aggr_worker_memory.to('G')
+        min_usable_memory_G = min_aggr_worker_memory_G * (int(viya_constants.VIYA_PERCENTAGE_OF_INSTANCE) / 100)
+        self.logger.info("percent %s percent of instance %s total capacity %s",
+                         viya_constants.VIYA_PERCENTAGE_OF_INSTANCE, min_usable_memory_G, total_capacity_memory_toGB)
+        self.logger.info("input memory converted to G %s", min_aggr_worker_memory_G)
+        # both sides are in G, so the magnitudes are compared without going through pint
+        if total_capacity_memory_toGB.magnitude < min_usable_memory_G.magnitude:
 
             aggregate_memory_failures += 1
             # Check for combined cpu_core capacity of the Kubernetes nodes in cluster
-        error_msg = viya_constants.SET + ': ' + \
-            str(round(total_capacity_memory_toGB, 2)) + ', ' + \
-            str(viya_constants.EXPECTED) + ': ' + self._viya_min_aggregate_worker_memory
+        error_msg = f"{viya_constants.SET}: {round(total_capacity_memory_toGB, 2)}, " \
+                    f"{viya_constants.EXPECTED}: {self._viya_min_aggregate_worker_memory}"
 
         if aggregate_memory_failures > 0:
             msg = error_msg
         else:
-            msg = info_msg + "," + viya_constants.MEMORY_WITHIN_RANGE
+            msg = f"{info_msg},{viya_constants.MEMORY_WITHIN_RANGE}"
 
-        aggregate_memory_data.update({'aggregate_memory_failures': msg +
-                                     ', Issues Found: ' + str(aggregate_memory_failures)})
+        aggregate_memory_data.update({'aggregate_memory_failures': f"{msg}, Issues Found: {aggregate_memory_failures}"})
         global_data.append(aggregate_memory_data)
-        return global_data
 
     def _check_k8s_errors(self, global_data, aggregate_k8s_failures):
         """
@@ -678,30 +708,29 @@ class ViyaPreInstallCheck():
 
         global_data: list with global data about worker nodes retrieved
         aggregate_k8s_failures:  count of k8s version errors
-        return: updated global data about worker nodes retrieved
         """
         aggregate_k8s_data = {}
         node_status_msg = ""
         if self._aggregate_nodeStatus_failures > 0:
-            node_status_msg = " Check Node(s). All Nodes NOT in Ready Status." \
-                              + ' Issues Found: ' + str(self._aggregate_nodeStatus_failures)
+            node_status_msg = f" Check Node(s). All Nodes NOT in Ready Status. " \
+                              f"Issues Found: {self._aggregate_nodeStatus_failures}"
         aggregate_k8s_data.update({'aggregate_k8s_failures': node_status_msg})
         if aggregate_k8s_failures > 0:
             aggregate_k8s_data.update({'aggregate_k8s_failures:':
-                                       'Check K8s Version on nodes.' +
-                                       ' Issues Found: ' + str(aggregate_k8s_failures) +
-                                       '.' + node_status_msg})
+                                       f"Check K8s Version on nodes. Issues Found: {aggregate_k8s_failures}."
+                                       f"{node_status_msg}"})
         global_data.append(aggregate_k8s_data)
 
-        return global_data
-
     def _get_raw_json(self, k8s_resource):
         """
         Retrieve kubernetes resource in json format
 
         k8s_resource: Kubernetes resource iformation to retrieve
-        return: information as raw json
+        return: information as raw json, cached per resource for the rest of the check
         """
+        if k8s_resource in self._raw_json_cache:
+            return self._raw_json_cache[k8s_resource]
+
         kubectl = self._kubectl
         raw_json = None
         return_code = 0
@@ -712,8 +741,9 @@ class ViyaPreInstallCheck():
             self.logger.exception("resource {} return code {}".format(str(k8s_resource), str(return_code)))
             return raw_json
 
-        self.logger.info("resource {} raw JSON {}".format(str(k8s_resource), str(raw_json)))
+        self.logger.info("resource %s raw JSON %s", k8s_resource, LazyPFormat(raw_json))
         assert isinstance(raw_json, object)
+        self._raw_json_cache[k8s_resource] = raw_json
         return raw_json
 
     def _check_available_namespaces(self, namespaces_json, namespace_data):
@@ -747,31 +777,27 @@ class ViyaPreInstallCheck():
 
         for node in storage_nodes:
 
-            if int(default_cnt) > 1 and node['default'] == "true":
+            if default_cnt > 1 and node['default'] == "true":
                 aggregate_storage_failures += 1
                 node.update({'status': 1})
-                node.update({'issue': 'Issues Found: ' + str(1)})
-                node.update(dict(firstFailure=viya_constants.SET + ': Multiple Default Storage Class found, ' +
-                            str(viya_constants.EXPECTED) + ": Minimum 1"))
+                node.update({'issue': 'Issues Found: 1'})
+                node.update(dict(firstFailure=f"{viya_constants.SET}: Multiple Default Storage Class found, "
+                                              f"{viya_constants.EXPECTED}: Minimum 1"))
             else:
                 node.update({'status': 0})
-                node.update({'issue': 'Issues Found: ' + str(0)})
-                node.update({'firstFailure': str("Issues Found: ") + str(aggregate_storage_failures)})
+                node.update({'issue': 'Issues Found: 0'})
+                node.update({'firstFailure': f"Issues Found: {aggregate_storage_failures}"})
 
         storage_global = []
         storage_issue_data = {}
         if len(storage_nodes) < 1:
             aggregate_storage_failures += 1
-        storage_issue_data['Issues'] = \
-            str(viya_constants.SET) + \
-            ': ' + str(len(storage_nodes)) + ', ' + \
-            str(viya_constants.EXPECTED) + \
-            ': Minimum 1' + ', ' \
-                            'Issues Found: ' + str(aggregate_storage_failures)
+        storage_issue_data['Issues'] = _MINIMUM_MSG_TMPL_.format(len(storage_nodes), 1) + ', ' + \
+            _ISSUES_FOUND_TMPL_.format(aggregate_storage_failures)
         storage_global.append(storage_issue_data)
         storage_global.append(storage_nodes)
 
-        self.logger.debug("storage global {}".format(pprint.pformat(storage_global)))
+        self.logger.debug("storage global %s", LazyPFormat(storage_global))
         return storage_global
 
     def evaluate_nodes(self, nodes_data, global_data, cluster_info, quantity_):
@@ -782,101 +808,102 @@ class ViyaPreInstallCheck():
         global_data: list of dictionary object with global data for nodes
         return:  return ist of dictionary objects with updated information and status
         """
-        aggregate_cpu_failures = int(0)
-        aggregate_memory_failures = int(0)
-        aggregate_k8s_failures = int(0)
-        total_cpu_cores = float(0)
+        aggregate_cpu_failures = 0
+        aggregate_memory_failures = 0
+        aggregate_k8s_failures = 0
+        # per-node capacities are collected as plain floats and summed once after the loop, rather than
+        # accumulating pint quantities node by node
+        worker_cpu_cores = []
+        capacity_memory_G = []
 
-        total_capacity_memory = quantity_("0G")
-        # register percetage unit with Pint
-        # ureg = pint.UnitRegistry()
-        # Q = ureg.Quantity
-        # ureg.define(UnitDefinition('percent', 'pct', (), ScaleConverter(1 / 100.0)))
+        # the check compares the cluster's server version, so it gives the same answer for every node
+        k8s_version_supported = self._k8s_server_version_min() if nodes_data else True
 
         for node in nodes_data:
-            self.logger.info("processing node " + pprint.pformat(node))
+            self.logger.info("processing node %s", LazyPFormat(node))
             capacity_cpu_cores = self._get_cpu_units(node, 'cpu')
-            # alloc_cpu_cores = self._get_cpu_units(node, 'allocatablecpu')
 
-            kubeletversion = str(node['kubeletversion'])
-            capacity_memory = str(node['memory'])
-            total_capacity_memory = total_capacity_memory + quantity_(capacity_memory).to('G')
+            kubeletversion = node['kubeletversion']
+            capacity_memory = node['memory']
+            capacity_memory_G.append(self._memory_to_G(capacity_memory, quantity_))
 
-            try:
-                nodeReady = str(node['Ready'])
-                if nodeReady == "True":
-                    pass
-                else:
-                    self._aggregate_nodeStatus_failures += 1
-            except KeyError:
+            nodeReady = node.get('Ready')
+            if nodeReady is None:
                 node['Ready'] = viya_constants.KEY_NOT_FOUND
+            elif nodeReady != "True":
+                self._aggregate_nodeStatus_failures += 1
 
             if node['worker']:
-                total_cpu_cores = total_cpu_cores + capacity_cpu_cores
-                self.logger.info("worker total_cpu_cores {}".format(str(total_cpu_cores)))
+                worker_cpu_cores.append(capacity_cpu_cores)
 
-                self._set_status(0, node, 'cpu')
                 node['error']['cpu'] = "See below."
-
-                self._set_status(0, node, 'capacityMemory')
                 node['error']['capacityMemory'] = "See below."
 
-            if (self._k8s_server_version_min()):
-                self._set_status(0, node, 'kubeletversion')
-                self.logger.debug("node kubeletversion status 0 {} ".format(pprint.pformat(node)))
+            # nodes start with status 0 and firstFailure PASS, so only a failure needs to update them
+            if k8s_version_supported:
+                self.logger.debug("node kubeletversion status 0 %s ", LazyPFormat(node))
             else:
-                self._set_status(1, node, 'kubeletversion')
-                node['error']['kubeletversion'] = viya_constants.SET + ': ' + kubeletversion + ', ' + \
-                    str(viya_constants.EXPECTED) + ': ' + self._validated_kubernetes_version_min + ' or later '
+                node['status'] = 1
+                node['firstFailure'] = "FAIL: kubeletversion"
+                node['error']['kubeletversion'] = _K8S_VERSION_MSG_TMPL_.format(kubeletversion,
+                                                                                self._validated_kubernetes_version_min)
 
                 aggregate_k8s_failures += 1
-                self.logger.debug("aggregate_k8s_failures {} ".format(str(aggregate_k8s_failures)))
-                self.logger.debug("node kubeletversion{} ".format(pprint.pformat(node)))
+                self.logger.debug("aggregate_k8s_failures %s ", aggregate_k8s_failures)
+                self.logger.debug("node kubeletversion%s ", LazyPFormat(node))
 
-        global_data = self._check_workers(global_data, nodes_data)
-        global_data = self._set_time(global_data)
-        global_data = self._check_cpu_errors(global_data, total_cpu_cores, aggregate_cpu_failures)
-        global_data = self._check_memory_errors(global_data, total_capacity_memory, quantity_,
-                                                aggregate_memory_failures)
+        total_cpu_cores = float(sum(worker_cpu_cores))
+        total_capacity_memory = quantity_(sum(capacity_memory_G), 'G')
+        self.logger.info("worker total_cpu_cores %s", total_cpu_cores)
 
-        global_data = self._check_k8s_errors(global_data, aggregate_k8s_failures)
+        self._check_workers(global_data, nodes_data)
+        self._set_time(global_data)
+        self._check_cpu_errors(global_data, total_cpu_cores, aggregate_cpu_failures)
+        self._check_memory_errors(global_data, total_capacity_memory, quantity_, aggregate_memory_failures)
+        self._check_k8s_errors(global_data, aggregate_k8s_failures)
 
         global_data.append(nodes_data)
-        global_data = self._update_k8s_version(global_data, self._k8s_server_version)
-        self.logger.debug("nodes_data {}".format(pprint.pformat(nodes_data)))
+        self._update_k8s_version(global_data, self._k8s_server_version)
+        self.logger.debug("nodes_data %s", LazyPFormat(nodes_data))
         return global_data
 
+    def _memory_to_G(self, memory, quantity_):
+        """
+        Convert a Kubernetes memory quantity to its magnitude in G without building a pint Quantity.
+        Values that are not plain Kubernetes quantities are left to pint.
+
+        memory: memory quantity string, e.g. 16331764Ki
+        quantity_: the Pint quantities object
+        return:  memory in G as float
+        """
+        # binary suffixes are two characters, decimal suffixes one, and a plain number is in bytes
+        for suffix in (memory[-2:], memory[-1:], ''):
+            if suffix in _MEMORY_SUFFIX_SCALE_:
+                break
+        try:
+            number = float(memory[:len(memory) - len(suffix)])
+        except ValueError:
+            return quantity_(memory).to('G').magnitude
+        return number * (_MEMORY_SUFFIX_SCALE_[suffix] / 1e9)
+
     def _get_cpu_units(self, node, key):
         """ Calculate the CPU cores if it has been expressed in millicores
             node: node dictionary object
             return:  value of vCPU
         """
-        try:
-            # ## Switch to capacity cpu core
-            cpu_cores = float(node[key])
-        except ValueError:
+        cores, millicores, _ = node[key].partition('m')
+        if millicores:
             # CPU is measured in units called millicores. Each node in the cluster introspects the operating system
             # to determine the amount of CPU cores on the node and then multiples that value by 1000 to express
             # its total capacity.
-            cpu_cores = float(str(node[key]).rstrip('m')) / 1000
+            cpu_cores = float(cores) / 1000
+        else:
+            # ## Switch to capacity cpu core
+            cpu_cores = float(cores)
 
-        self.logger.info("cpu_cores {} {}".format(key, str(cpu_cores)))
+        self.logger.info("cpu_cores %s %s", key, cpu_cores)
         return cpu_cores
 
-    def _set_status(self, status, node, key):
-        """Set the status flag on dictionary object with node details - to indicate compliance with
-        cpu, memory k8s version requirements
-
-        status: status to be set on dict objectwith node details
-        node: node dictionary object
-        return:  return dictionary object with updated node status information
-        """
-        if status != 0:
-            node.update({'status': status})
-            node.update({'firstFailure': str("FAIL: " + key)})
-
-        return node
-
     def get_nested_nodes_info(self, nodes_json, quantity_):
         """
         Parse the json to load node information into a list of dictionary objects
@@ -889,76 +916,54 @@ class ViyaPreInstallCheck():
 
         if nodes_json:
             for node in nodes_json['items']:
+                taint_types = node.get('spec', {}).get('taints')
+                taint_found = taint_types is not None
+                taint_types = taint_types or []
+                taint_no_schedule = any(tnode.get('effect') == 'NoSchedule' for tnode in taint_types)
+                taint_master = any(tnode.get('key') == 'node-role.kubernetes.io/master' for tnode in taint_types)
+
+                # control plane nodes are not workers and are left out before any node details are read
+                if taint_no_schedule and taint_master:
+                    continue
+
+                capacity = node['status']['capacity']
+                allocatable = node['status']['allocatable']
+                node_info = node['status']['nodeInfo']
+                # the fixed fields are set in one literal; the address and condition types vary by node and are
+                # added below, which is why the node details stay a dict
                 node_data = {'error': {}, 'nodeName': node['metadata']['name'],
-                             'cpu': node['status']['capacity']['cpu']}
-
-                node_data['memory'] = node['status']['capacity']['memory']
-                node_data['allocatableephemeral'] = node['status']['allocatable']['ephemeral-storage']
-                node_data['allocatablecpu'] = node['status']['allocatable']['cpu']
-                node_data['allocatableMemory'] = node['status']['allocatable']['memory']
-                node_data['podscapacity'] = node['status']['capacity']['pods']
-                node_data['kubeletversion'] = node['status']['nodeInfo']['kubeletVersion']
-                node_data['containerRuntimeVersion'] = node['status']['nodeInfo']['containerRuntimeVersion']
-                node_data['kernelVersion'] = node['status']['nodeInfo']['kernelVersion']
-                node_data['osImage'] = node['status']['nodeInfo']['osImage']
-                node_data['status'] = int(0)
-                node_data['firstFailure'] = 'PASS'
-                node_data['taintNoSchedule'] = False
-                node_data['taintMaster'] = False
-                node_data['worker'] = True
-
-                addresses = (node['status']['addresses'])
-                address_type = []
-                address_addr = []
-                address_type = self._get_nested_info(addresses, address_type, 'type')
-                address_addr = self._get_nested_info(addresses, address_addr, 'address')
+                             'cpu': capacity['cpu'],
+                             'memory': capacity['memory'],
+                             'allocatableephemeral': allocatable['ephemeral-storage'],
+                             'allocatablecpu': allocatable['cpu'],
+                             'allocatableMemory': allocatable['memory'],
+                             'podscapacity': capacity['pods'],
+                             'kubeletversion': node_info['kubeletVersion'],
+                             'containerRuntimeVersion': node_info['containerRuntimeVersion'],
+                             'kernelVersion': node_info['kernelVersion'],
+                             'osImage': node_info['osImage'],
+                             'status': 0,
+                             'firstFailure': 'PASS',
+                             'taintNoSchedule': taint_no_schedule,
+                             'taintMaster': taint_master,
+                             'worker': True}
+
+                if not taint_found:
+                    node_data['taint'] = viya_constants.KEY_NOT_FOUND
+                labels = node['metadata'].get('labels', {})
+                node_data['agentpool'] = labels.get('agentpool', viya_constants.KEY_NOT_FOUND)
+                node_data['instance'] = labels.get('node.kubernetes.io/instance-type', viya_constants.KEY_NOT_FOUND)
 
-                try:
-                    taint_types = node['spec']['taints']
-                    for tnode in taint_types:
-                        taint_keys = tnode.keys()
-                        for key in taint_keys:
-                            if tnode[key] == 'NoSchedule':
-                                node_data.update({'taintNoSchedule': True})
+                # each address and condition is keyed by its type, e.g. InternalIP or Ready
+                for address in node['status']['addresses']:
+                    node_data[address['type']] = address['address']
+                for condition in node['status']['conditions']:
+                    node_data[condition['type']] = condition['status']
 
-                            if tnode[key] == 'node-role.kubernetes.io/master':
-                                node_data.update({'taintMaster': True})
+                nodes_data.append(node_data)
+                self._workers += 1
 
-                except KeyError:
-                    node_data['taint'] = viya_constants.KEY_NOT_FOUND
-                try:
-                    node_data['agentpool'] = (node['metadata']['labels']['agentpool'])
-                except KeyError:
-                    node_data['agentpool'] = viya_constants.KEY_NOT_FOUND
-                try:
-                    node_data['instance'] = (node['metadata']['labels']['node.kubernetes.io/instance-type'])
-                except KeyError:
-                    node_data['instance'] = viya_constants.KEY_NOT_FOUND
-
-                addr_len = len(address_type)
-                for j in range(addr_len):
-                    addr_t = str(address_type[j][0])
-                    addr_a = str(address_addr[j][0])
-                    node_data[addr_t] = addr_a
-
-                conditions = (node['status']['conditions'])
-                conditions_type = []
-                conditions_status = []
-                conditions_type = self._get_nested_info(conditions, conditions_type, 'type')
-                conditions_status = self._get_nested_info(conditions, conditions_status, 'status')
-                type_length = len(conditions_type)
-                for i in range(type_length):
-                    var1 = str(conditions_type[i][0])
-                    var2 = str(conditions_status[i][0])
-                    node_data[var1] = var2
-
-                if node_data['taintNoSchedule'] and node_data["taintMaster"]:
-                    node_data.update({'worker': False})
-                else:
-                    nodes_data.append(node_data)
-                    self._workers += 1
-
-        self.logger.debug("nodes_data {}".format(pprint.pformat(nodes_data)))
+        self.logger.debug("nodes_data %s", LazyPFormat(nodes_data))
         return nodes_data
 
     def _get_config_json(self):
@@ -977,7 +982,7 @@ class ViyaPreInstallCheck():
             self.logger.exception("CalledProcessorError rc {}".format(str(return_code)))
             config_json = None
 
-        self.logger.debug("config view JSON{} return_code{}".format(str(config_json), str(return_code)))
+        self.logger.debug("config view JSON%s return_code%s", LazyPFormat(config_json), return_code)
         return config_json, return_code
 
     def _get_memory(self, limit, key, quantity_):
@@ -1030,12 +1035,9 @@ class ViyaPreInstallCheck():
             self.logger.error(viya_messages.CONFIG_ERROR)
             sys.exit(viya_messages.BAD_CONFIG_RC_)
         else:
-            configs_data = self._get_config_current_context(config_json, configs_data)
-            configs_data = self._get_config_contexts(config_json, configs_data)
-            configs_data = self._get_config_clusters(config_json, configs_data)
-            configs_data = self._get_config_users(config_json, configs_data)
+            configs_data = self._extract_config(config_json)
 
-        self.logger.debug("configs_data {}".format(configs_data))
+        self.logger.debug("configs_data %s", LazyPFormat(configs_data))
         return configs_data
 
     def get_calculated_aggregate_memory(self):
@@ -1063,31 +1065,28 @@ class ViyaPreInstallCheck():
 
         return: A list of dictionary objects with config information
         """
-        # make sure path is valid #
-        if output_directory != "" and not output_directory.endswith(os.sep):
-            output_directory = output_directory + os.sep
-        report_file_path = output_directory + _REPORT_FILE_NAME_TMPL_.format(file_timestamp)
-        templates_dir = os.path.dirname(os.path.realpath(__file__)) + os.sep + ".." + os.sep + "templates" + os.sep
-
-        template_renderer = Jinja2TemplateRenderer(templates_dir=templates_dir)
+        file_timestamp = get_file_timestamp()
+        report_file_path = os.path.join(output_directory, _REPORT_FILE_NAME_TMPL_.format(file_timestamp))
+        log_file_path = os.path.join(output_directory, _REPORT_LOG_NAME_TMPL_.format(file_timestamp))
+        # as_html returns the absolute path of the written report #
         report_file_path = \
-            template_renderer.as_html(
-                    "report_template_viya_pre_install_check.j2",
+            _get_report_renderer().as_html(
+                    _REPORT_TEMPLATE_NAME_,
                     report_file_path,
                     trim_blocks=True, lstrip_blocks=True,
                     global_data=global_data, master_data=master_data,
                     configs_data=configs_data,
                     storage_data=storage_data,
                     namespace_data=namespace_data,
-                    cluster_admin_permission_data=cluster_admin_permission_data.items(),
-                    namespace_admin_permission_data=namespace_admin_permission_data.items(),
+                    cluster_admin_permission_data=tuple(cluster_admin_permission_data.items()),
+                    namespace_admin_permission_data=tuple(namespace_admin_permission_data.items()),
                     namespace_admin_permission_aggregate=ns_admin_permission_aggregate['Permissions'],
                     cluster_admin_permission_aggregate=cluster_admin_permission_aggregate['Permissions'],
                     cluster_creation_info=viya_messages.CLUSTER_CREATION_INFO,
                     sizings_info=viya_messages.SIZINGS_INFO)
 
         print("Created: {}".format(report_file_path))
-        print("Created: {}".format(output_directory + _REPORT_LOG_NAME_TMPL_.format(file_timestamp)))
+        print("Created: {}".format(log_file_path))
         print()
 
-        return os.path.abspath(report_file_path)
+        return report_file_path
@@ -13,11 +13,10 @@
 import os
 from typing import List
 
-import pprint
 from pre_install_report.library.utils import viya_constants
 from pre_install_report.library.pre_install_utils import PreCheckUtils
 from viya_ark_library.k8s.k8s_resource_type_values import KubernetesResourceTypeValues
-from viya_ark_library.logging import ViyaARKLogger
+from viya_ark_library.logging import LazyPFormat, ViyaARKLogger
 from viya_ark_library.k8s.sas_k8s_objects import KubernetesResource
 
 PVC_AZURE_FILE = "pvc_azure_file.yaml"
@@ -69,6 +68,8 @@ class PreCheckPermissions(object):
 
         self._storage_class_sc: List[KubernetesResource] = None
         self._k8s_git_version = params.get(viya_constants.SERVER_K8S_VERSION)
+        # raw json already retrieved by ViyaPreInstallCheck, keyed by resource name
+        self._raw_json_cache = params.get(viya_constants.RAW_JSON_CACHE) or {}
 
     def _set_results_cluster_admin(self, resource_key, rc):
         """
@@ -117,7 +118,7 @@ class PreCheckPermissions(object):
 
         """
         if pvc_file:
-            self.logger.info("pvc_file {}".format(pprint.pformat(pvc_file.as_dict())))
+            self.logger.info("pvc_file %s", LazyPFormat(pvc_file.as_dict()))
             if (pvc_file.get_status_value("phase") == "Bound"):
                 self._set_results_namespace_admin(key, 0)
                 self.logger.info("{} status {}".format(pvc_name, pvc_file.get_status_value("phase")))
@@ -207,7 +208,7 @@ class PreCheckPermissions(object):
         else:
             self._skip_pvc_check()
 
-        self.logger.debug("Namespaced results {}".format(pprint.pformat(self.namespace_admin_permission_data)))
+        self.logger.debug("Namespaced results %s", LazyPFormat(self.namespace_admin_permission_data))
 
     def _skip_pvc_check(self):
         self.namespace_admin_permission_data[viya_constants.PERM_AZ_FILE] = viya_constants.PERM_SKIPPING
@@ -228,10 +229,16 @@ class PreCheckPermissions(object):
 
     def get_sc_resources(self):
         """
-         Uses viyaARK_library common library to retrieve kubernetes resources kind=storage class
+         Uses viyaARK_library common library to retrieve kubernetes resources kind=storage class.
+         The storage classes already retrieved for the report are reused when available.
          return k8s_resource: List of Kubernetes resources
         """
-        self._storage_class_sc = self.utils.get_resources(KubernetesResourceTypeValues.K8S_STORAGE_STORAGE_CLASSES)
+        storage_class_json = self._raw_json_cache.get('storageclass')
+        if storage_class_json is not None:
+            self._storage_class_sc = [KubernetesResource(item) for item in storage_class_json.get('items', [])]
+        else:
+            self._storage_class_sc = \
+                self.utils.get_resources(KubernetesResourceTypeValues.K8S_STORAGE_STORAGE_CLASSES)
         if not self._storage_class_sc:
             self.cluster_admin_permission_data[viya_constants.PERM_GET + viya_constants.PERM_STORAGE_CLASS] = \
                 viya_constants.INSUFFICIENT_PERMS
@@ -252,7 +259,7 @@ class PreCheckPermissions(object):
         if self._storage_class_sc is None:
             return storage_classes
         for k8s_resource in k8s_resources:
-            self.logger.debug("As Dict {}".format(pprint.pformat(k8s_resource.as_dict())))
+            self.logger.debug("As Dict %s", LazyPFormat(k8s_resource.as_dict()))
             self.logger.debug("name {} provisioner{} storageaccounttype {} type {} selfLink {} skuName {}".
                               format(str(k8s_resource.get_name()),
                                      str(k8s_resource.get_provisioner()),
@@ -292,7 +299,7 @@ class PreCheckPermissions(object):
                                         PVC_AWS_EBS,
                                         str(k8s_resource.get_provisioner()),
                                         str(k8s_resource.get_parameter_value('type'))))
-        self.logger.debug("Provisioner {} ".format(pprint.pformat(storage_classes)))
+        self.logger.debug("Provisioner %s ", LazyPFormat(storage_classes))
         return storage_classes
 
     def _set_results_namespace_admin_crd(self, resource_key, rc):
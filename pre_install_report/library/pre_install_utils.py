@@ -13,13 +13,12 @@
 
 from subprocess import CalledProcessError
 import os
-import pprint
 from typing import List, Dict
 
 from pre_install_report.library.utils import viya_constants
 from viya_ark_library.k8s.sas_kubectl_interface import KubectlInterface, KubernetesAvailableResourceTypes
 from viya_ark_library.k8s.sas_k8s_objects import KubernetesResource
-from viya_ark_library.logging import ViyaARKLogger
+from viya_ark_library.logging import LazyPFormat, ViyaARKLogger
 
 
 class PreCheckUtils(object):
@@ -160,9 +159,8 @@ class PreCheckUtils(object):
                                                                          str(resource_name), str(return_code)))
             return k8s_resource
 
-        self.logger.debug("resource {} {} KubernetesResource {}".format(str(resource_kind),
-                                                                        str(resource_name),
-                                                                        pprint.pformat(k8s_resource.as_dict())))
+        self.logger.debug("resource %s %s KubernetesResource %s", resource_kind, resource_name,
+                          LazyPFormat(k8s_resource.as_dict()))
         return k8s_resource
 
     def get_k8s_version(self):
@@ -187,6 +185,6 @@ class PreCheckUtils(object):
         return:  relative path to specified file.
         """
         current_dir = os.path.dirname(os.path.abspath(__file__))
-        file_path = os.path.join(current_dir, "utils" + os.sep + file_name)
+        file_path = os.path.join(current_dir, "utils", file_name)
 
         return file_path
@@ -52,3 +52,4 @@ PERM_CR_RBAC = "Custom Resource with RBAC "
 VIYA_PERCENTAGE_OF_INSTANCE = "85"
 MEMORY_WITHIN_RANGE = " Memory within Range"
 SERVER_K8S_VERSION = "Server_k8s_version"
+RAW_JSON_CACHE = "Raw_json_cache"
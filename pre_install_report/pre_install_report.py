@@ -12,7 +12,6 @@
 ####################################################################
 
 from typing import Optional, Text
-import datetime
 import pprint
 import sys
 import os
@@ -21,7 +20,7 @@ import getopt
 import configparser
 
 from pre_install_report.library.utils import viya_messages
-from pre_install_report.library.pre_install_check import ViyaPreInstallCheck
+from pre_install_report.library.pre_install_check import ViyaPreInstallCheck, get_file_timestamp
 from viya_ark_library.command import Command
 from viya_ark_library.k8s.sas_k8s_errors import NamespaceNotFoundError
 from viya_ark_library.k8s.sas_kubectl import Kubectl
@@ -33,10 +32,6 @@ PRP = pprint.PrettyPrinter(indent=4)
 # templates for output file names #
 _REPORT_FILE_NAME_TMPL_ = "viya_pre_install_report_{}.html"
 _REPORT_LOG_NAME_TMPL_ = "viya_pre_install_log_{}.log"
-_FILE_TIMESTAMP_TMPL_ = "%Y-%m-%dT%H_%M_%S"
-
-# set timestamp for report file
-file_timestamp = datetime.datetime.now().strftime(_FILE_TIMESTAMP_TMPL_)
 
 ##############################################
 #     CLASS: PreInstallReportCommand     #
@@ -188,7 +183,7 @@ def main(argv):
             print(viya_messages.OUPUT_PATH_ERROR)
             usage(viya_messages.BAD_OPT_RC_)
 
-    report_log_path = output_dir + _REPORT_LOG_NAME_TMPL_.format(file_timestamp)
+    report_log_path = output_dir + _REPORT_LOG_NAME_TMPL_.format(get_file_timestamp())
 
     try:
         logging.FileHandler(report_log_path)
@@ -11,19 +11,23 @@
 #                                                                ###
 ####################################################################
 import os
-import sys
 
 import pprint
 import json
 import logging
+import pytest
 import semantic_version
 
+from subprocess import CalledProcessError
+
 from pint import UnitRegistry
 
 from pre_install_report.library.utils import viya_constants
-from pre_install_report.library.pre_install_check import ViyaPreInstallCheck
+from pre_install_report.library.pre_install_check import ViyaPreInstallCheck, _get_unit_registry
 from pre_install_report.library.pre_install_check_permissions import PreCheckPermissions
+from pre_install_report.library.pre_install_utils import PreCheckUtils
 from viya_ark_library.jinja2.sas_jinja2 import Jinja2TemplateRenderer
+from viya_ark_library.k8s.test_impl.sas_kubectl_test import KubectlTest
 from viya_ark_library.logging import ViyaARKLogger
 from pre_install_report.pre_install_report import read_environment_var
 from pre_install_report.library.utils import viya_messages
@@ -42,8 +46,6 @@ viya_kubenetes_version = "1.22.4"
 viya_min_aggregate_worker_CPU_cores = '12'
 viya_min_aggregate_worker_memory = '56G'
 
-# setup sys.path for import of viya_constants
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)))
 # turn off logging
 sas_logger = ViyaARKLogger("test_report.log", logging_level=logging.NOTSET, logger_name="debug_logger")
 
@@ -63,49 +65,152 @@ def test_get_storage_classes_json():
     print('\r', (storage_data[0]))
     print('\r', (storage_data[1]))
     assert len(storage_data) == 2
+    # two of the three storage classes carry the beta default annotation
+    assert [node['default'] for node in storage_data[1]] == ['false', 'true', 'true']
+    assert storage_data[0]['Issues'].endswith('Issues Found: 2')
 
     template_render(global_data, configs_data, storage_data, 'storage_classes_info.html')
 
 
-def test_read_cluster_info_output():
+def test_get_master_nodes_json():
     vpc = createViyaPreInstallCheck(viya_k8s_version_min,
                                     viya_min_aggregate_worker_CPU_cores,
                                     viya_min_aggregate_worker_memory)
+
     cluster_info = "Kubernetes master is running at https://0.0.0.0:6443\n" + \
                    "KubeDNS is running at " + \
                    "https://0.0.0.0:6443/api/v1/namespaces/kube-system/services/kube-dns:dns/proxy\n"
-    data = vpc._read_cluster_info_output(cluster_info)
-    assert(not os.path.exists("temp_cluster_info.txt"))
-    assert(len(str(data)) > 0)
+    master_data = vpc._check_master(cluster_info)
+    assert master_data[0]['totalMasters'] == '1'
+    assert master_data[0]['status'] == 0
+    assert "Kubernetes master is running at https://0.0.0.0:6443" in master_data[0]['firstFailure']
+
 
+class _CountingKubectl(object):
+    """Minimal kubectl stand-in counting how often cluster information is requested"""
+    def __init__(self):
+        self.calls = {'get_namespace': 0, 'cluster_info': 0}
 
-def test_delete_temp_file():
+    def get_namespace(self):
+        self.calls['get_namespace'] += 1
+        return 'default'
+
+    def cluster_info(self):
+        self.calls['cluster_info'] += 1
+        return "Kubernetes control plane is running at https://0.0.0.0:6443\n"
+
+    def get_resources(self, k8s_resource, raw=False):
+        self.calls[k8s_resource] = self.calls.get(k8s_resource, 0) + 1
+        return {'items': []}
+
+
+def test_cluster_info_fetched_once(tmp_path, monkeypatch):
+    # run from an empty directory so any scratch file written to the working directory is caught
+    monkeypatch.chdir(tmp_path)
     vpc = createViyaPreInstallCheck(viya_k8s_version_min,
                                     viya_min_aggregate_worker_CPU_cores,
                                     viya_min_aggregate_worker_memory)
+    kubectl = _CountingKubectl()
+    vpc._kubectl = kubectl
 
-    file_name = "temp_cluster_info_test.txt"
-    data = "Some data"
-    file = open(file_name, "w+")
-    file.writelines(str(data))
-    file.close()
-    assert(os.path.exists(file_name))
-    vpc._delete_temp_file(file_name)
-    assert (not os.path.exists("temp_cluster_info.txt"))
+    assert vpc._get_namespace() == vpc._get_namespace() == 'default'
+    assert vpc._get_master_json() == vpc._get_master_json()
+    assert kubectl.calls == {'get_namespace': 1, 'cluster_info': 1}
+    # the output is used in memory, no scratch file is written to the working directory
+    assert os.listdir(str(tmp_path)) == []
 
 
-def test_get_master_nodes_json():
+def test_raw_json_fetched_once_per_resource():
+    vpc = createViyaPreInstallCheck(viya_k8s_version_min,
+                                    viya_min_aggregate_worker_CPU_cores,
+                                    viya_min_aggregate_worker_memory)
+    kubectl = _CountingKubectl()
+    vpc._kubectl = kubectl
+
+    assert vpc._get_json("nodes") is vpc._get_json("nodes")
+    vpc._get_json("storageclass")
+    assert kubectl.calls['nodes'] == 1
+    assert kubectl.calls['storageclass'] == 1
+
+
+class _RecordingKubectlTest(KubectlTest):
+    """KubectlTest recording the raw resource listings requested, optionally failing a combined listing"""
+    def __init__(self, fail_combined=False, **kwargs):
+        super().__init__(**kwargs)
+        self.fail_combined = fail_combined
+        self.raw_gets = []
+
+    def get_resources(self, type_version_group, raw=False):
+        if raw:
+            self.raw_gets.append(type_version_group)
+            if self.fail_combined and "," in type_version_group:
+                raise CalledProcessError(1, f"kubectl get {type_version_group} -o json")
+        return super().get_resources(type_version_group, raw)
+
+
+@pytest.mark.parametrize("fail_combined, expected_gets", [
+    # the resources are listed with a single kubectl get
+    (False, ["namespaces,nodes"]),
+    # each resource is listed on its own when the combined get fails
+    (True, ["namespaces,nodes", "namespaces", "nodes"])
+])
+def test_get_json_multi(fail_combined, expected_gets):
     vpc = createViyaPreInstallCheck(viya_k8s_version_min,
                                     viya_min_aggregate_worker_CPU_cores,
                                     viya_min_aggregate_worker_memory)
+    kubectl = _RecordingKubectlTest(fail_combined)
+    vpc._kubectl = kubectl
 
-    cluster_info = "Kubernetes master is running at https://0.0.0.0:6443\n" + \
-                   "KubeDNS is running at " + \
-                   "https://0.0.0.0:6443/api/v1/namespaces/kube-system/services/kube-dns:dns/proxy\n"
-    master_data = vpc._check_master(cluster_info)
-    assert master_data[0]['totalMasters'] == '1'
-    assert master_data[0]['status'] == 0
-    assert "Kubernetes master is running at https://0.0.0.0:6443" in master_data[0]['firstFailure']
+    vpc._get_json_multi({"namespaces": "Namespace", "nodes": "Node"})
+    for resource in ("namespaces", "nodes"):
+        expected = [k8s_resource.as_dict() for k8s_resource in KubectlTest().get_resources(resource)]
+        assert expected
+        assert vpc._get_json(resource)['items'] == expected
+    assert kubectl.raw_gets == expected_gets
+
+
+def test_get_json_multi_not_listable():
+    vpc = createViyaPreInstallCheck(viya_k8s_version_min,
+                                    viya_min_aggregate_worker_CPU_cores,
+                                    viya_min_aggregate_worker_memory)
+    kubectl = _RecordingKubectlTest(include_non_namespaced_resources=False)
+    vpc._kubectl = kubectl
+
+    # the combined get fails when nodes and namespaces may not be listed, and so does each single get
+    vpc._get_json_multi({"namespaces": "Namespace", "nodes": "Node"})
+    assert kubectl.raw_gets == ["namespaces,nodes", "namespaces", "nodes"]
+    assert vpc._raw_json_cache == {}
+
+
+class _RecordingPermissions(object):
+    """PreCheckPermissions stand-in recording the order of the permission probes"""
+    def __init__(self, storage_classes):
+        self.storage_classes = storage_classes
+        self.calls = []
+
+    def __getattr__(self, name):
+        return lambda *args: self.calls.append((name,) + args)
+
+    def get_storage_classes_details(self):
+        return self.storage_classes
+
+
+def test_check_permissions_order():
+    vpc = createViyaPreInstallCheck(viya_k8s_version_min,
+                                    viya_min_aggregate_worker_CPU_cores,
+                                    viya_min_aggregate_worker_memory)
+    probes = [('check_deploy_crd',), ('check_rbac_role',), ('check_create_custom_resource',),
+              ('check_get_custom_resource', 'default'), ('check_delete_custom_resource',),
+              ('check_rbac_delete_role',), ('check_delete_crd',)]
+    apply_pvc = ('manage_pvc', viya_constants.KUBECTL_APPLY, False)
+    check_and_delete_pvc = [('manage_pvc', viya_constants.KUBECTL_APPLY, True),
+                            ('manage_pvc', viya_constants.KUBECTL_DELETE, False)]
+
+    # the PVCs are applied before the CRD and RBAC probes, and checked and deleted after them
+    for storage_classes in ([('default', 'azurefile')], []):
+        permissions = _RecordingPermissions(storage_classes)
+        vpc._check_permissions(permissions, 'default')
+        assert permissions.calls == [('get_sc_resources',), apply_pvc] + probes + check_and_delete_pvc
 
 
 def test_ranchersingle_get_master_nodes_json():
@@ -333,9 +438,25 @@ def test_get_config_info():
     assert(configs_data[2][0]['clustername']) == "kubernetes"
     assert(configs_data[3][0]['username']) == "kubernetes-admin"
     assert(configs_data[3][1]['username']) == "kubernetes-test"
+    assert vpc._extract_config(data) == configs_data
     template_render(global_data, configs_data, storage_data, 'config_report.html')
 
 
+def test_get_config_info_missing_fields():
+    vpc = createViyaPreInstallCheck(viya_k8s_version_min,
+                                    viya_min_aggregate_worker_CPU_cores,
+                                    viya_min_aggregate_worker_memory)
+    data = {'current-context': 'ctx', 'contexts': [{'name': 'ctx'}], 'clusters': [{}], 'users': [{}]}
+
+    configs_data = vpc._extract_config(data)
+    assert configs_data[1][0] == {'contextName': 'ctx',
+                                  'cluster': viya_constants.KEY_NOT_FOUND,
+                                  'clusteruser': viya_constants.KEY_NOT_FOUND}
+    assert configs_data[2][0] == {'clustername': viya_constants.KEY_NOT_FOUND,
+                                  'server': viya_constants.KEY_NOT_FOUND}
+    assert configs_data[3][0] == {'username': viya_constants.KEY_NOT_FOUND}
+
+
 def test_ranchersingle_test_get_config_info():
     vpc = createViyaPreInstallCheck(viya_k8s_version_min,
                                     viya_min_aggregate_worker_CPU_cores,
@@ -659,3 +780,61 @@ def test_check_permissions():
     # perms.check_delete_custom_resource(namespace, debug)
     # perms.check_rbac_delete_role(namespace, debug)
     # perms.check_delete_crd(namespace, debug)
+
+
+def test_check_rbac_role():
+    utils = PreCheckUtils({viya_constants.KUBECTL: KubectlTest(), 'logger': sas_logger})
+    perms = PreCheckPermissions({'logger': sas_logger, viya_constants.PERM_CLASS: utils})
+    perms.check_rbac_role()
+
+    assert perms.get_cluster_admin_permission_data()[viya_constants.PERM_CREATE + viya_constants.PERM_ROLE] == \
+        viya_constants.ADEQUATE_PERMS
+    namespace_data = perms.get_namespace_admin_permission_data()
+    assert namespace_data[viya_constants.PERM_CREATE + viya_constants.PERM_SA] == viya_constants.ADEQUATE_PERMS
+    assert namespace_data[viya_constants.PERM_CREATE + viya_constants.PERM_ROLEBINDING] == \
+        viya_constants.ADEQUATE_PERMS
+
+
+def test_check_rbac_role_failure():
+    # the test kubectl fails every apply outside of its expected namespace
+    utils = PreCheckUtils({viya_constants.KUBECTL: KubectlTest(namespace='unexpected'), 'logger': sas_logger})
+    perms = PreCheckPermissions({'logger': sas_logger, viya_constants.PERM_CLASS: utils})
+    perms.check_rbac_role()
+
+    assert perms.get_cluster_admin_permission_data()[viya_constants.PERM_CREATE + viya_constants.PERM_ROLE] == \
+        viya_constants.INSUFFICIENT_PERMS
+    namespace_data = perms.get_namespace_admin_permission_data()
+    assert namespace_data[viya_constants.PERM_CREATE + viya_constants.PERM_SA].startswith(
+        viya_constants.INSUFFICIENT_PERMS)
+    assert namespace_data[viya_constants.PERM_CREATE + viya_constants.PERM_ROLEBINDING].startswith(
+        viya_constants.INSUFFICIENT_PERMS)
+    assert perms.get_namespace_admin_permission_aggregate()[viya_constants.PERM_PERMISSIONS].startswith(
+        viya_constants.INSUFFICIENT_PERMS)
+
+
+def test_get_sc_resources_uses_raw_json_cache():
+    storage_classes = {'apiVersion': 'v1', 'kind': 'List',
+                       'items': [{'kind': 'StorageClass', 'metadata': {'name': 'default'}, 'provisioner': 'disk'}]}
+    # utils is not provided, so any kubectl lookup would fail
+    perms = PreCheckPermissions({'logger': sas_logger,
+                                 viya_constants.RAW_JSON_CACHE: {'storageclass': storage_classes}})
+    perms.get_sc_resources()
+
+    assert [sc.get_name() for sc in perms._storage_class_sc] == ['default']
+    assert perms.get_cluster_admin_permission_data()[viya_constants.PERM_GET + viya_constants.PERM_STORAGE_CLASS] \
+        == viya_constants.ADEQUATE_PERMS
+
+
+def test_memory_to_G_matches_pint():
+    vpc = createViyaPreInstallCheck(viya_k8s_version_min,
+                                    viya_min_aggregate_worker_CPU_cores,
+                                    viya_min_aggregate_worker_memory)
+    quantity_ = register_pint()
+    for memory in ['16331764Ki', '1000Mi', '1.5Gi', '56G', '129e6', '512', '1E', '2Ti']:
+        assert vpc._memory_to_G(memory, quantity_) == quantity_(memory).to('G').magnitude
+
+
+def test_unit_registry_shared():
+    ureg = _get_unit_registry()
+    assert _get_unit_registry() is ureg
+    assert ureg.Quantity('1Gi').to('Ki').magnitude == 1024 ** 2
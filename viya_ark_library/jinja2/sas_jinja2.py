@@ -12,7 +12,7 @@
 import os
 
 from jinja2 import Environment, FileSystemLoader, select_autoescape
-from typing import AnyStr, List, Text, Union
+from typing import AnyStr, Dict, List, Text, Tuple, Union
 
 
 class Jinja2TemplateRenderer(object):
@@ -40,6 +40,32 @@ class Jinja2TemplateRenderer(object):
 
         self.file_loader: FileSystemLoader = FileSystemLoader(templates)
 
+        # environments keyed by their (trim_blocks, lstrip_blocks) options, kept so that compiled templates are reused
+        # across renders #
+        self._environments: Dict[Tuple[bool, bool], Environment] = dict()
+
+    def get_environment(self, trim_blocks: bool = False, lstrip_blocks: bool = False) -> Environment:
+        """
+        Returns the Jinja2 Environment for the given options, creating it on first use.
+
+        The Environment caches each template once it has been loaded and compiled, so rendering the same template
+        again with this renderer does not parse it again.
+
+        :param trim_blocks: If set to True the first newline after a block is removed. Defaults to False.
+        :param lstrip_blocks: If set to True leading spaces and tabs are stripped from start of a block line. Defaults
+                              to False.
+        :return: The Environment for finding and compiling templates.
+        """
+        env: Environment = self._environments.get((trim_blocks, lstrip_blocks))
+
+        if env is None:
+            # create environment object for finding templates #
+            env = Environment(loader=self.file_loader, autoescape=select_autoescape(["html", "xml"]),
+                              trim_blocks=trim_blocks, lstrip_blocks=lstrip_blocks, auto_reload=False)
+            self._environments[(trim_blocks, lstrip_blocks)] = env
+
+        return env
+
     def as_html(self, template_name: Text, destination: Text, trim_blocks: bool = False, lstrip_blocks: bool = False,
                 *args, **kwargs) -> AnyStr:
         """
@@ -54,11 +80,10 @@ class Jinja2TemplateRenderer(object):
         :param kwargs: Any keyword-ed values needed to render the template.
         :return: The absolute path to tne newly created file.
         """
-        # create environment object for finding templates #
-        env: Environment = Environment(loader=self.file_loader, autoescape=select_autoescape(["html", "xml"]),
-                                       trim_blocks=trim_blocks, lstrip_blocks=lstrip_blocks)
+        # get the environment for these options #
+        env: Environment = self.get_environment(trim_blocks=trim_blocks, lstrip_blocks=lstrip_blocks)
 
-        # get the template #
+        # get the template, compiled on first use #
         template = env.get_template(template_name)
 
         # render the template #
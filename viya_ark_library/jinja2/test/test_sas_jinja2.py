@@ -50,3 +50,27 @@ def test_as_html_non_utf8_content():
 
     # clean up file
     os.remove(created_file)
+
+
+def test_as_html_reuses_compiled_template():
+    # get the current directory of this script to create absolute path
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    # join the path to this file with the remaining path to the requested test data
+    templates_dir = os.path.join(current_dir, "templates")
+
+    jinja2_renderer = Jinja2TemplateRenderer(templates_dir)
+
+    env = jinja2_renderer.get_environment()
+    assert jinja2_renderer.get_environment() is env
+    assert jinja2_renderer.get_environment(trim_blocks=True, lstrip_blocks=True) is not env
+
+    created_file = jinja2_renderer.as_html("unit_test.html.j2", "unit_test.html", test_page_content="Hello World!")
+    template = env.get_template("unit_test.html.j2")
+    created_file = jinja2_renderer.as_html("unit_test.html.j2", "unit_test.html", test_page_content="Hello Again!")
+
+    assert env.get_template("unit_test.html.j2") is template
+    with open(created_file) as f:
+        assert "Hello Again!" in f.read()
+
+    # clean up file
+    os.remove(created_file)
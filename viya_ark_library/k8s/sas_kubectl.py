@@ -20,6 +20,13 @@ from viya_ark_library.k8s.sas_k8s_objects import KubernetesAvailableResourceType
 from viya_ark_library.k8s.sas_kubectl_interface import KubectlInterface
 from viya_ark_library.k8s.sas_k8s_ingress import SupportedIngress
 
+# get_resources decodes the resource listings returned to every caller with orjson when it is installed;
+# orjson is an optional dependency and the standard library json module is used when it is not available
+try:
+    from orjson import loads as _loads_resource_json
+except ImportError:
+    from json import loads as _loads_resource_json
+
 # header values used in retrieving values returned by kubectl
 _HEADER_NAME_ = "NAME"
 _HEADER_SHORTNAME_ = "SHORTNAMES"
@@ -415,10 +422,10 @@ class Kubectl(KubectlInterface):
 
         # return the raw response, if requested
         if raw:
-            return json.loads(resource_json.decode())
+            return _loads_resource_json(resource_json)
 
         # convert json into python native list
-        resources_list: List = json.loads(resource_json.decode()).get(KubernetesResourceKeys.ITEMS)
+        resources_list: List = _loads_resource_json(resource_json).get(KubernetesResourceKeys.ITEMS)
 
         # iterate all dictionary definitions in the list and create Resource objects
         resources: List[KubernetesResource] = list()
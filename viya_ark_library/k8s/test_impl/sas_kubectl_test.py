@@ -523,6 +523,15 @@ class KubectlTest(KubectlInterface):
         if self.simulate_empty_deployment:
             return list()
 
+        # handle a comma-separated list of resource types, which kubectl returns together as a single List
+        if "," in type_version_group:
+            items: List = list()
+            for resource_type in type_version_group.split(","):
+                items.extend(resource.as_dict() for resource in self.get_resources(resource_type))
+            if raw:
+                return {"apiVersion": "v1", "kind": "List", "items": items}
+            return [KubernetesResource(item) for item in items]
+
         # handle any ingress simulation - this logic covers scenarios where no resources would be returned
         # Contour
         if type_version_group.lower() == KubernetesResourceTypeValues.CONTOUR_HTTP_PROXIES and \
@@ -558,6 +567,10 @@ class KubectlTest(KubectlInterface):
         # if the resource should not be represented as unavailable, load the response from the file
         resources_dict: Dict = KubectlTest._load_response_data(f"resources_{type_version_group.lower()}.json")
 
+        # return the items as the List kubectl responds with, if requested
+        if raw:
+            return {"apiVersion": "v1", "kind": "List", "items": resources_dict}
+
         # convert the raw JSON to KubernetesResource objects
         resources: List[KubernetesResource] = list()
         for resource in resources_dict:
@@ -653,7 +666,11 @@ class KubectlTest(KubectlInterface):
         ]
 
     def manage_resource(self, action: Text, file: Text, ignore_errors: bool = False) -> AnyStr:
-        # this method is not functional in the testing implementation
+        # raise a CalledProcessError if an unexpected namespace is given
+        if self.namespace != self.Values.NAMESPACE:
+            raise CalledProcessError(1, f"kubectl -n {self.namespace} {action} -f {file}")
+
+        # otherwise nothing is applied or deleted in the testing implementation
         pass
 
     def top_nodes(self, ignore_errors: bool = False) -> KubernetesMetrics:
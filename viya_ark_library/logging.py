@@ -10,13 +10,38 @@
 #                                                                ###
 ####################################################################
 
-from typing import Text
+from typing import Any, Text
 import logging
 import datetime
+import pprint
 
 _LOGGER_TIMESTAMP_TMPL_ = "%Y-%m-%dT%H_%M_%S"
 
 
+class LazyPFormat(object):
+    """
+    The LazyPFormat class wraps an object passed as a logging argument so that it is pretty-printed only if the
+    message is actually emitted.
+
+    Example Usage:
+        my_logger.debug("resource %s", LazyPFormat(resource_dict))
+    """
+
+    def __init__(self, obj: Any):
+        """
+        Constructor for LazyPFormat.
+
+        :param obj: The object to pretty-print when the log message is formatted.
+        """
+        self.obj = obj
+
+    def __str__(self) -> Text:
+        """
+        Return the pretty-printed object.
+        """
+        return pprint.pformat(self.obj)
+
+
 class ViyaARKLogger(object):
     """
     The ViyaARKLogger class represents a custom Logger, which can be instantiated my multiple tools.
@@ -0,0 +1,24 @@
+####################################################################
+# ### test_logging.py                                            ###
+####################################################################
+# ### Author: SAS Institute Inc.                                 ###
+####################################################################
+#                                                                ###
+# Copyright (c) 2021, SAS Institute Inc., Cary, NC, USA.         ###
+# All Rights Reserved.                                           ###
+# SPDX-License-Identifier: Apache-2.0                            ###
+#                                                                ###
+####################################################################
+import pprint
+
+from viya_ark_library.logging import LazyPFormat
+
+
+def test_lazy_pformat_str() -> None:
+    """
+    Tests that LazyPFormat renders the same text as pprint.pformat().
+    """
+    data = {"kind": "Node", "items": [{"name": "node-{}".format(i), "cpu": i} for i in range(20)]}
+
+    assert str(LazyPFormat(data)) == pprint.pformat(data)
+    assert "value %s" % LazyPFormat([1, 2]) == "value [1, 2]"